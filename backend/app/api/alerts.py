@@ -0,0 +1,141 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import bindparam, text, update
+from sqlmodel import Session, select, func
+from app.core.db import get_session
+from app.domain.models import BudgetAlert, CategoryTotals, CostCategory, CostItem
+from app.domain.logic import evaluate_budget_rules, COMMITTED_STATUSES
+
+router = APIRouter()
+
+# (category_id, amount, status) of a cost item before/after a write
+ItemState = tuple[int, Decimal, str]
+
+# Creates a category's totals row from the ledger unless another writer already did
+_BACKFILL_TOTALS = text("""
+    INSERT INTO categorytotals (category_id, actual_total, committed_paid_total)
+    SELECT :category_id, COALESCE(SUM(amount), 0),
+           COALESCE(SUM(CASE WHEN status IN :committed THEN amount END), 0)
+    FROM costitem WHERE category_id = :category_id
+    ON CONFLICT (category_id) DO NOTHING
+""").bindparams(bindparam("committed", value=list(COMMITTED_STATUSES), expanding=True))
+
+def item_state(item: CostItem) -> ItemState:
+    return (item.category_id, Decimal(str(item.amount)), item.status)
+
+def record_item_change(session: Session, before: Optional[ItemState], after: Optional[ItemState]):
+    """
+    Apply one cost item write to the running totals of the categories it
+    touches and re-evaluate their budget rules. Call after mutating the item
+    but before commit, so everything lands in the same transaction.
+    """
+    deltas = defaultdict(lambda: [Decimal("0.00"), Decimal("0.00")])
+    for state, sign in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        category_id, amount, status = state
+        deltas[category_id][0] += sign * amount
+        if status in COMMITTED_STATUSES:
+            deltas[category_id][1] += sign * amount
+
+    # Pending item changes must not be flushed before a lazy backfill reads the old sums
+    with session.no_autoflush:
+        for category_id, (actual_delta, committed_delta) in deltas.items():
+            totals = _apply_deltas(session, category_id, actual_delta, committed_delta)
+            category = session.get(CostCategory, category_id)
+            if category is not None:
+                evaluate_category(session, category, totals)
+
+def record_category_change(session: Session, category: CostCategory):
+    """Re-evaluate a category's rules after its projected total changed."""
+    with session.no_autoflush:
+        evaluate_category(session, category, _apply_deltas(session, category.id))
+
+def forget_category(session: Session, category_id: int):
+    """Drop running totals and alerts of a deleted category."""
+    totals = session.get(CategoryTotals, category_id)
+    if totals:
+        session.delete(totals)
+    for alert in session.exec(select(BudgetAlert).where(BudgetAlert.category_id == category_id)).all():
+        session.delete(alert)
+
+def evaluate_category(session: Session, category: CostCategory, totals: CategoryTotals):
+    """Open alerts for newly breached rules, resolve those no longer breached."""
+    projected = Decimal(str(category.projected_total))
+    breached = evaluate_budget_rules(projected, totals.actual_total, totals.committed_paid_total)
+    open_alerts = {
+        alert.rule: alert
+        for alert in session.exec(
+            select(BudgetAlert).where(
+                BudgetAlert.category_id == category.id,
+                BudgetAlert.resolved_at == None,  # noqa: E711
+            )
+        ).all()
+    }
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for rule, amount in breached.items():
+        if rule not in open_alerts:
+            session.add(BudgetAlert(
+                category_id=category.id, rule=rule, amount=amount,
+                projected_total=projected, triggered_at=now,
+            ))
+    for rule, alert in open_alerts.items():
+        if rule not in breached:
+            alert.resolved_at = now
+            session.add(alert)
+
+def rebuild_category_totals(session: Session):
+    """Recompute every category's running totals from the ledger (repairs drift)."""
+    committed = func.sum(CostItem.amount).filter(CostItem.status.in_(COMMITTED_STATUSES))
+    rows = session.exec(
+        select(CostItem.category_id, func.sum(CostItem.amount), committed).group_by(CostItem.category_id)
+    ).all()
+    sums = {category_id: (actual, committed_paid) for category_id, actual, committed_paid in rows}
+    for category in session.exec(select(CostCategory)).all():
+        actual, committed_paid = sums.get(category.id, (None, None))
+        totals = session.get(CategoryTotals, category.id) or CategoryTotals(category_id=category.id)
+        totals.actual_total = actual or Decimal("0.00")
+        totals.committed_paid_total = committed_paid or Decimal("0.00")
+        session.add(totals)
+        evaluate_category(session, category, totals)
+
+def _apply_deltas(
+    session: Session,
+    category_id: int,
+    actual_delta: Decimal = Decimal("0.00"),
+    committed_delta: Decimal = Decimal("0.00"),
+) -> CategoryTotals:
+    """
+    Add deltas to a category's running totals in SQL and return the stored result.
+    The UPDATE locks the totals row until commit, so concurrent writes to one
+    category neither lose updates nor evaluate its rules at the same time.
+    """
+    # First write since totals existed: backfill this category only
+    session.execute(_BACKFILL_TOTALS, {"category_id": category_id})
+    session.execute(
+        update(CategoryTotals)
+        .where(CategoryTotals.category_id == category_id)
+        .values(
+            actual_total=CategoryTotals.actual_total + actual_delta,
+            committed_paid_total=CategoryTotals.committed_paid_total + committed_delta,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return session.get(CategoryTotals, category_id, populate_existing=True)
+
+@router.get("/alerts", response_model=list[BudgetAlert])
+def get_alerts(
+    category_id: Optional[int] = Query(None),
+    include_resolved: bool = Query(False),
+    session: Session = Depends(get_session)
+):
+    """List budget alerts, newest first; open alerts only unless include_resolved."""
+    statement = select(BudgetAlert).order_by(BudgetAlert.triggered_at.desc(), BudgetAlert.id.desc())
+    if category_id is not None:
+        statement = statement.where(BudgetAlert.category_id == category_id)
+    if not include_resolved:
+        statement = statement.where(BudgetAlert.resolved_at == None)  # noqa: E711
+    return session.exec(statement).all()
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from app.core.db import get_session
 from app.domain.models import CostCategory
+from app.api.alerts import record_category_change, forget_category
 
 router = APIRouter()
 
@@ -40,6 +41,7 @@ def update_category(
         setattr(existing, key, value)
         
     session.add(existing)
+    record_category_change(session, existing)
     session.commit()
     session.refresh(existing)
     return existing
@@ -53,6 +55,7 @@ def delete_category(category_id: int, session: Session = Depends(get_session)):
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
+    forget_category(session, category.id)
     session.delete(category)
     session.commit()
     return {"ok": True}
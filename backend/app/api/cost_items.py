@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlmodel import Session, select
 from app.core.db import get_session
+from app.core.encoding import negotiate
+from app.api.alerts import item_state, record_item_change
 from app.domain.models import CostItem
 from typing import Optional
 
@@ -8,11 +10,15 @@ router = APIRouter()
 
 @router.get("/cost-items", response_model=list[CostItem])
 def get_cost_items(
+    request: Request,
     category_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     session: Session = Depends(get_session)
 ):
-    """List all cost items, optionally filtered by category_id or status."""
+    """
+    List all cost items, optionally filtered by category_id or status.
+    Send `Accept: application/x-msgpack` for the compact binary encoding.
+    """
     statement = select(CostItem)
     
     if category_id is not None:
@@ -21,7 +27,7 @@ def get_cost_items(
         statement = statement.where(CostItem.status == status)
     
     items = session.exec(statement).all()
-    return items
+    return negotiate(request, items)
 
 @router.get("/cost-items/{item_id}", response_model=CostItem)
 def get_cost_item(item_id: int, session: Session = Depends(get_session)):
@@ -39,6 +45,7 @@ def create_cost_item(item: CostItem, session: Session = Depends(get_session)):
     """Create a new cost item."""
     item.id = None  # Ensure new ID
     session.add(item)
+    record_item_change(session, None, item_state(item))
     session.commit()
     session.refresh(item)
     return item
@@ -57,9 +64,11 @@ def update_cost_item(
         raise HTTPException(status_code=404, detail="Cost item not found")
     
     # Update fields
+    before = item_state(existing)
     item_data = item_in.model_dump(exclude_unset=True, exclude={"id"})
     existing.sqlmodel_update(item_data)
     session.add(existing)
+    record_item_change(session, before, item_state(existing))
     session.commit()
     session.refresh(existing)
     return existing
@@ -74,5 +83,6 @@ def delete_cost_item(item_id: int, session: Session = Depends(get_session)):
         raise HTTPException(status_code=404, detail="Cost item not found")
     
     session.delete(item)
+    record_item_change(session, item_state(item), None)
     session.commit()
     return {"ok": True}
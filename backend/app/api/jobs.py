@@ -0,0 +1,133 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select, func
+from app.core.db import get_session
+from app.core.jobs import (
+    JobContext, JobRunner, JobQueueFull, UnknownJobKind, FINISHED_STATUSES,
+    get_job_runner, job_kind,
+)
+from app.domain.models import CostItem, FixedCosts, Job, JobStatus, JobSubmit, OperationalInputs
+from app.domain.logic import calculate_forecast
+from app.api.project_summary import build_project_summary
+from app.api.alerts import rebuild_category_totals
+
+router = APIRouter()
+
+# --- Job kinds ---
+
+@job_kind("scenario_batch")
+def run_scenario_batch(params: dict, ctx: JobContext):
+    """params: {"inputs": [OperationalInputs, ...]} -> list of FinancialSnapshot."""
+    batch = [OperationalInputs(**inputs) for inputs in params.get("inputs", [])]
+    costs = ctx.session.exec(select(FixedCosts).limit(1)).first() or FixedCosts()
+    snapshots = []
+    for index, inputs in enumerate(batch):
+        snapshots.append(calculate_forecast(inputs, costs).model_dump(mode="json"))
+        ctx.progress((index + 1) / len(batch))
+    return snapshots
+
+LEDGER_EXPORT_BATCH = 1000
+
+@job_kind("ledger_export")
+def run_ledger_export(params: dict, ctx: JobContext):
+    """Full CostItem ledger, read in keyset-paginated batches."""
+    total = ctx.session.exec(select(func.count(CostItem.id))).one()
+    rows, last_id = [], 0
+    while True:
+        # Fetch each batch completely: an open cursor would hold SQLite's shared
+        # lock and block the progress write on the status connection
+        batch = ctx.session.exec(
+            select(CostItem).where(CostItem.id > last_id).order_by(CostItem.id).limit(LEDGER_EXPORT_BATCH)
+        ).all()
+        if not batch:
+            return rows
+        rows.extend(item.model_dump(mode="json") for item in batch)
+        last_id = batch[-1].id
+        ctx.progress(len(rows) / total)
+
+@job_kind("rollup_rebuild")
+def run_rollup_rebuild(params: dict, ctx: JobContext):
+    """Project cost rollup across every category; also resyncs running totals and alerts."""
+    rebuild_category_totals(ctx.session)
+    ctx.session.commit()
+    summary = build_project_summary(ctx.session, on_category=lambda done, total: ctx.progress(done / total))
+    return summary.model_dump(mode="json")
+
+# --- Endpoints ---
+
+def _to_status(job: Job) -> JobStatus:
+    return JobStatus.model_validate(job, from_attributes=True)
+
+def _get_or_404(session: Session, job_id: str) -> Job:
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.post("/jobs", response_model=JobStatus, status_code=202)
+def submit_job(job_in: JobSubmit, runner: JobRunner = Depends(get_job_runner)):
+    """Queue a computation and return its id immediately."""
+    try:
+        job = runner.submit(job_in.kind, job_in.params)
+    except UnknownJobKind:
+        raise HTTPException(status_code=422, detail=f"Unknown job kind: {job_in.kind}")
+    except JobQueueFull:
+        raise HTTPException(status_code=503, detail="Job queue is full", headers={"Retry-After": "5"})
+    return _to_status(job)
+
+@router.get("/jobs", response_model=list[JobStatus])
+def get_jobs(session: Session = Depends(get_session), runner: JobRunner = Depends(get_job_runner)):
+    """List unexpired jobs, newest first."""
+    runner.purge_expired()
+    jobs = session.exec(select(Job).order_by(Job.created_at.desc())).all()
+    return [_to_status(job) for job in jobs]
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+def get_job(job_id: str, session: Session = Depends(get_session)):
+    """Poll a job's status and progress."""
+    return _to_status(_get_or_404(session, job_id))
+
+@router.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str, session: Session = Depends(get_session)):
+    """Result of a succeeded job; 409 while it is still running or if it did not succeed."""
+    job = _get_or_404(session, job_id)
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return job.result
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str, runner: JobRunner = Depends(get_job_runner)):
+    """Server-sent events with status/progress until the job finishes."""
+    def read_status():
+        with Session(runner.bind) as session:
+            job = session.get(Job, job_id)
+            return _to_status(job) if job else None
+
+    if await run_in_threadpool(read_status) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        last = None
+        while True:
+            status = await run_in_threadpool(read_status)
+            if status is None:
+                return
+            payload = status.model_dump_json()
+            if payload != last:
+                yield f"data: {payload}\n\n"
+                last = payload
+            if status.status in FINISHED_STATUSES:
+                return
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@router.delete("/jobs/{job_id}", response_model=JobStatus)
+def cancel_job(job_id: str, runner: JobRunner = Depends(get_job_runner)):
+    """Cancel a queued or running job."""
+    job = runner.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _to_status(job)
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session, select
+from app.core.db import get_session
+from app.domain.models import FixedCosts, OptimizerRequest, OptimizationResult
+from app.domain.optimizer import optimize_staffing
+
+router = APIRouter()
+
+@router.post("/optimize", response_model=OptimizationResult)
+def optimize(request: OptimizerRequest, session: Session = Depends(get_session)):
+    """Find the most profitable staffing/pricing plan within the given constraints."""
+    statement = select(FixedCosts).limit(1)
+    costs = session.exec(statement).first()
+    if not costs:
+        costs = FixedCosts()
+
+    try:
+        return optimize_staffing(request, costs)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
@@ -1,31 +1,40 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlmodel import Session, select, func
 from app.core.db import get_session
+from app.core.encoding import negotiate
 from app.domain.models import CostCategory, CostItem, CostCategorySummary, ProjectCostsSummary
 from decimal import Decimal
 
 router = APIRouter()
 
 @router.get("/project-summary", response_model=ProjectCostsSummary)
-def get_project_summary(session: Session = Depends(get_session)):
+def get_project_summary(request: Request, session: Session = Depends(get_session)):
     """
     Get aggregated project costs summary with category breakdowns.
     Calculates totals, variances, and percentages.
+    Send `Accept: application/x-msgpack` for the compact binary encoding.
+    """
+    return negotiate(request, build_project_summary(session))
+
+def build_project_summary(session: Session, on_category=None) -> ProjectCostsSummary:
+    """
+    Roll up actual spend per category against its projected total.
+    on_category(done, total) is called after each category, for progress reporting.
     """
     # Get all categories
     categories_stmt = select(CostCategory).order_by(CostCategory.sort_order)
     categories = session.exec(categories_stmt).all()
     
+    # Sum all cost items per category in one pass (exact: amounts are integer cents)
+    sums_stmt = select(CostItem.category_id, func.sum(CostItem.amount)).group_by(CostItem.category_id)
+    actual_by_category = dict(session.exec(sums_stmt).all())
+    
     category_summaries = []
     total_projected = Decimal("0.00")
     total_actual = Decimal("0.00")
     
-    for category in categories:
-        # Sum all cost items for this category
-        items_stmt = select(func.sum(CostItem.amount)).where(
-            CostItem.category_id == category.id
-        )
-        actual_total = session.exec(items_stmt).first() or Decimal("0.00")
+    for index, category in enumerate(categories):
+        actual_total = actual_by_category.get(category.id) or Decimal("0.00")
         
         # Calculate variance
         variance = category.projected_total - actual_total
@@ -42,6 +51,8 @@ def get_project_summary(session: Session = Depends(get_session)):
         
         total_projected += category.projected_total
         total_actual += actual_total
+        if on_category:
+            on_category(index + 1, len(categories))
     
     remaining_budget = total_projected - total_actual
     variance = total_projected - total_actual
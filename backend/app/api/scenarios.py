@@ -0,0 +1,145 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, select
+from app.core.db import get_session
+from app.domain.models import (
+    FixedCosts, OperationalInputs, FinancialSnapshot, SavedScenario,
+    ScenarioIn, ScenarioRead, ScenarioComparison,
+)
+from app.domain.logic import calculate_forecast, costs_version, diff_snapshots
+from typing import Optional
+
+router = APIRouter()
+
+def _get_fixed_costs(session: Session) -> FixedCosts:
+    statement = select(FixedCosts).limit(1)
+    return session.exec(statement).first() or FixedCosts()
+
+def refresh_stale(session: Session, scenarios: list[SavedScenario]) -> list[SavedScenario]:
+    """
+    Recompute every scenario whose snapshot was computed against an older
+    FixedCosts version. Costs are loaded once and changes committed in one go;
+    up-to-date scenarios are left untouched.
+    """
+    costs = _get_fixed_costs(session)
+    version = costs_version(costs)
+    stale = [s for s in scenarios if s.costs_version != version or s.snapshot is None]
+    for scenario in stale:
+        snapshot = calculate_forecast(OperationalInputs(**scenario.inputs), costs)
+        scenario.snapshot = snapshot.model_dump(mode="json")
+        scenario.costs_version = version
+        session.add(scenario)
+    if stale:
+        session.commit()
+        for scenario in stale:
+            session.refresh(scenario)
+    return scenarios
+
+def _load_snapshot(data: dict) -> FinancialSnapshot:
+    # Table models skip validation on construction, so rebuild FixedCosts explicitly
+    fixed_costs = FixedCosts.model_validate(data["fixed_costs"])
+    return FinancialSnapshot.model_validate({**data, "fixed_costs": fixed_costs})
+
+def _to_read(scenario: SavedScenario) -> ScenarioRead:
+    return ScenarioRead(
+        id=scenario.id,
+        name=scenario.name,
+        is_baseline=scenario.is_baseline,
+        inputs=OperationalInputs(**scenario.inputs),
+        snapshot=_load_snapshot(scenario.snapshot),
+        costs_version=scenario.costs_version,
+    )
+
+def _get_or_404(session: Session, scenario_id: int) -> SavedScenario:
+    scenario = session.get(SavedScenario, scenario_id)
+    if not scenario:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+    return scenario
+
+def _apply(session: Session, scenario: SavedScenario, scenario_in: ScenarioIn) -> SavedScenario:
+    duplicate = session.exec(
+        select(SavedScenario).where(SavedScenario.name == scenario_in.name)
+    ).first()
+    if duplicate and duplicate.id != scenario.id:
+        raise HTTPException(status_code=409, detail="Scenario name already exists")
+
+    if scenario_in.is_baseline:
+        # Only one baseline at a time
+        for other in session.exec(select(SavedScenario).where(SavedScenario.is_baseline)).all():
+            if other.id != scenario.id:
+                other.is_baseline = False
+                session.add(other)
+
+    scenario.name = scenario_in.name
+    scenario.is_baseline = scenario_in.is_baseline
+    scenario.inputs = scenario_in.inputs.model_dump(mode="json")
+    scenario.snapshot = None  # inputs changed: force recompute
+    scenario.costs_version = None
+    refresh_stale(session, [scenario])
+    return scenario
+
+@router.get("/scenarios", response_model=list[ScenarioRead])
+def get_scenarios(session: Session = Depends(get_session)):
+    """List saved scenarios, recomputing stale snapshots in bulk."""
+    scenarios = session.exec(select(SavedScenario).order_by(SavedScenario.name)).all()
+    return [_to_read(s) for s in refresh_stale(session, list(scenarios))]
+
+@router.get("/scenarios/compare", response_model=ScenarioComparison)
+def compare_scenarios(
+    scenario_id: int = Query(...),
+    baseline_id: Optional[int] = Query(None),
+    session: Session = Depends(get_session)
+):
+    """
+    Compare a scenario against another one, or against the baseline scenario
+    when baseline_id is omitted. Only stale snapshots are recomputed.
+    """
+    scenario = _get_or_404(session, scenario_id)
+    if baseline_id is not None:
+        baseline = _get_or_404(session, baseline_id)
+    else:
+        baseline = session.exec(select(SavedScenario).where(SavedScenario.is_baseline)).first()
+        if not baseline:
+            raise HTTPException(status_code=404, detail="No baseline scenario set")
+
+    refresh_stale(session, [baseline, scenario])
+    base_snapshot = _load_snapshot(baseline.snapshot)
+    snapshot = _load_snapshot(scenario.snapshot)
+
+    return ScenarioComparison(
+        baseline_id=baseline.id,
+        scenario_id=scenario.id,
+        deltas=diff_snapshots(base_snapshot, snapshot),
+        baseline_risk_flags=base_snapshot.risk_flags,
+        scenario_risk_flags=snapshot.risk_flags,
+    )
+
+@router.get("/scenarios/{scenario_id}", response_model=ScenarioRead)
+def get_scenario(scenario_id: int, session: Session = Depends(get_session)):
+    """Get a single saved scenario, recomputing it if stale."""
+    scenario = _get_or_404(session, scenario_id)
+    refresh_stale(session, [scenario])
+    return _to_read(scenario)
+
+@router.post("/scenarios", response_model=ScenarioRead)
+def create_scenario(scenario_in: ScenarioIn, session: Session = Depends(get_session)):
+    """Save a named scenario and compute its snapshot."""
+    scenario = _apply(session, SavedScenario(name=scenario_in.name, inputs={}), scenario_in)
+    return _to_read(scenario)
+
+@router.put("/scenarios/{scenario_id}", response_model=ScenarioRead)
+def update_scenario(
+    scenario_id: int,
+    scenario_in: ScenarioIn,
+    session: Session = Depends(get_session)
+):
+    """Update a saved scenario's name/inputs and recompute its snapshot."""
+    scenario = _apply(session, _get_or_404(session, scenario_id), scenario_in)
+    return _to_read(scenario)
+
+@router.delete("/scenarios/{scenario_id}")
+def delete_scenario(scenario_id: int, session: Session = Depends(get_session)):
+    """Delete a saved scenario."""
+    scenario = _get_or_404(session, scenario_id)
+    session.delete(scenario)
+    session.commit()
+    return {"ok": True}
@@ -0,0 +1,107 @@
+from decimal import Decimal, InvalidOperation
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from pydantic import ValidationError
+from sqlmodel import Session, select
+from app.core.db import get_session
+from app.core.xlsx import stream_workbook, iter_sheet_rows
+from app.domain.models import (
+    CostCategory, CostItem, FixedCosts, FinancialSnapshot, OperationalInputs,
+    SavedScenario, PnlImportResult,
+)
+from app.domain.logic import calculate_forecast
+from app.domain.pnl import pnl_rows, parse_pnl_rows, field_label, INPUT_FIELDS
+from app.api.scenarios import refresh_stale
+
+router = APIRouter()
+
+PNL_SHEET = "P&L"
+LEDGER_COLUMNS = ("id", "category_id", "description", "vendor", "amount", "status", "date", "notes")
+SCENARIO_SNAPSHOT_COLUMNS = tuple(
+    name for name in FinancialSnapshot.model_fields
+    if name not in ("fixed_costs", "risk_flags")
+)
+
+def _get_fixed_costs(session: Session) -> FixedCosts:
+    statement = select(FixedCosts).limit(1)
+    return session.exec(statement).first() or FixedCosts()
+
+@router.post("/export/forecast.xlsx")
+def export_forecast(inputs: OperationalInputs, session: Session = Depends(get_session)):
+    """Forecast for the given inputs as a P&L workbook."""
+    snapshot = calculate_forecast(inputs, _get_fixed_costs(session))
+    return stream_workbook([(PNL_SHEET, pnl_rows(inputs, snapshot))], "forecast.xlsx")
+
+@router.get("/export/scenarios.xlsx")
+def export_scenarios(session: Session = Depends(get_session)):
+    """Saved scenarios as a grid: one row per scenario, inputs then snapshot figures."""
+    scenarios = refresh_stale(session, list(session.exec(select(SavedScenario).order_by(SavedScenario.name)).all()))
+
+    def rows():
+        yield ["Name", "Baseline"] + [field_label(n) for n in INPUT_FIELDS + SCENARIO_SNAPSHOT_COLUMNS]
+        for scenario in scenarios:
+            inputs = OperationalInputs(**scenario.inputs)
+            snapshot = scenario.snapshot
+            yield (
+                [scenario.name, scenario.is_baseline]
+                + [getattr(inputs, n) for n in INPUT_FIELDS]
+                + [_cell(snapshot[n]) for n in SCENARIO_SNAPSHOT_COLUMNS]
+            )
+
+    return stream_workbook([("Scenarios", rows())], "scenarios.xlsx")
+
+@router.get("/export/ledger.xlsx")
+def export_ledger(session: Session = Depends(get_session)):
+    """Full CostItem ledger, read from the DB in batches while the sheet is written."""
+    category_names = dict(session.exec(select(CostCategory.id, CostCategory.name)).all())
+
+    def rows():
+        yield [field_label(c) for c in LEDGER_COLUMNS] + ["Category"]
+        statement = select(CostItem).order_by(CostItem.id).execution_options(yield_per=1000)
+        for item in session.exec(statement):
+            yield [getattr(item, c) for c in LEDGER_COLUMNS] + [category_names.get(item.category_id)]
+
+    return stream_workbook([("Ledger", rows())], "ledger.xlsx")
+
+@router.post("/import/pnl", response_model=PnlImportResult)
+def import_pnl(file: UploadFile = File(...), session: Session = Depends(get_session)):
+    """
+    Import a P&L sheet: fixed cost lines update the stored FixedCosts,
+    operational lines are returned as OperationalInputs (when complete).
+    """
+    try:
+        fixed_data, input_data, rows_read = parse_pnl_rows(iter_sheet_rows(file.file, PNL_SHEET))
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Could not read workbook: {e}")
+
+    costs = session.exec(select(FixedCosts).limit(1)).first()
+    if costs is None:
+        costs = FixedCosts()
+    if fixed_data:
+        costs.sqlmodel_update(fixed_data)
+        session.add(costs)
+        session.commit()
+        session.refresh(costs)
+
+    inputs, input_errors = None, []
+    if input_data:
+        try:
+            inputs = OperationalInputs(**input_data)
+        except ValidationError as e:
+            input_errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
+
+    return PnlImportResult(
+        rows_read=rows_read,
+        fixed_costs_updated=sorted(fixed_data),
+        fixed_costs=costs,
+        inputs=inputs,
+        input_errors=input_errors,
+    )
+
+def _cell(value):
+    # Snapshot JSON stores Decimals as strings; write numbers so Excel can sum them
+    if isinstance(value, str):
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return value
+    return value
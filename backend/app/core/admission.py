@@ -0,0 +1,168 @@
+"""
+Admission control for expensive endpoints.
+
+Each matching request must get a slot from its route's limiter and from its
+priority class's limiter before it reaches the app. Slots are bounded; a
+bounded number of requests may wait for one, and anything past that (or
+waiting longer than queue_timeout) is rejected immediately with
+503 + Retry-After. This keeps bulk calls from occupying the whole sync
+threadpool, so cheap routes like /health and /costs keep their latency.
+
+Priority classes:
+  * critical    - never limited (health checks, metrics)
+  * interactive - default for anything without a rule; not limited
+  * bulk        - heavy reads/computations; limited per route and as a class
+"""
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Optional
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+@dataclass(frozen=True)
+class PriorityClass:
+    name: str
+    max_concurrency: Optional[int] = None  # None = unlimited
+    max_queue: int = 0
+    queue_timeout: float = 5.0
+
+@dataclass(frozen=True)
+class AdmissionRule:
+    path: str
+    priority: str
+    methods: tuple[str, ...] = ("GET",)
+    max_concurrency: Optional[int] = None
+    max_queue: int = 0
+
+DEFAULT_CLASSES = (
+    PriorityClass("critical"),
+    PriorityClass("interactive"),
+    PriorityClass("bulk", max_concurrency=6, max_queue=12, queue_timeout=5.0),
+)
+
+DEFAULT_RULES = (
+    AdmissionRule("/health", "critical"),
+    AdmissionRule("/metrics/admission", "critical"),
+    AdmissionRule("/project-summary", "bulk", max_concurrency=3, max_queue=6),
+    AdmissionRule("/cost-items", "bulk", max_concurrency=3, max_queue=6),
+    AdmissionRule("/scenarios", "bulk", max_concurrency=2, max_queue=4),
+    AdmissionRule("/scenarios/compare", "bulk", max_concurrency=2, max_queue=4),
+    AdmissionRule("/optimize", "bulk", methods=("POST",), max_concurrency=2, max_queue=4),
+    AdmissionRule("/export/ledger.xlsx", "bulk", max_concurrency=1, max_queue=2),
+    AdmissionRule("/export/scenarios.xlsx", "bulk", max_concurrency=1, max_queue=2),
+    AdmissionRule("/import/pnl", "bulk", methods=("POST",), max_concurrency=1, max_queue=2),
+)
+
+class Limiter:
+    """Concurrency slots plus a bounded wait queue, with counters for metrics."""
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked() and self.queued >= self.max_queue:
+            self.rejected += 1
+            return False
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.queued -= 1
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+class AdmissionController:
+    def __init__(self, rules=DEFAULT_RULES, classes=DEFAULT_CLASSES, retry_after: int = 1):
+        self.enabled = True
+        self.retry_after = retry_after
+        self._classes = {c.name: c for c in classes}
+        self._rules = {(rule.path, method): rule for rule in rules for method in rule.methods}
+        self._class_limiters = {
+            c.name: Limiter(c.name, c.max_concurrency, c.max_queue, c.queue_timeout)
+            for c in classes if c.max_concurrency is not None
+        }
+        self._route_limiters = {
+            rule.path: Limiter(rule.path, rule.max_concurrency, rule.max_queue, self._classes[rule.priority].queue_timeout)
+            for rule in rules if rule.max_concurrency is not None
+        }
+
+    def limiters_for(self, method: str, path: str) -> list[Limiter]:
+        """Route limiter first, then class limiter; empty if unlimited."""
+        rule = self._rules.get((path, method))
+        if rule is None:
+            return []
+        limiters = []
+        if rule.path in self._route_limiters:
+            limiters.append(self._route_limiters[rule.path])
+        if rule.priority in self._class_limiters:
+            limiters.append(self._class_limiters[rule.priority])
+        return limiters
+
+    def metrics(self) -> dict:
+        return {
+            "routes": {name: l.stats() for name, l in self._route_limiters.items()},
+            "classes": {name: l.stats() for name, l in self._class_limiters.items()},
+        }
+
+class AdmissionMiddleware:
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.controller.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        acquired = []
+        try:
+            for limiter in self.controller.limiters_for(scope["method"], scope["path"]):
+                if not await limiter.acquire():
+                    await self._reject(send)
+                    return
+                acquired.append(limiter)
+            await self.app(scope, receive, send)
+        finally:
+            for limiter in reversed(acquired):
+                limiter.release()
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Server busy, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.controller.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+admission_controller = AdmissionController()
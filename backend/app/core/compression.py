@@ -0,0 +1,91 @@
+"""
+Response compression above a size threshold.
+
+Brotli is preferred when the client accepts it and the optional `brotli`
+package is installed; gzip otherwise. Only complete (non-streaming) bodies
+of compressible media types are touched, so streamed downloads and event
+streams pass through unchanged.
+"""
+import gzip
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_COMPRESSIBLE_PREFIXES = ("text/", "application/json", "application/x-msgpack", "application/problem+json")
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Pick br or gzip from an Accept-Encoding header, or None."""
+    accepted = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        q = 1.0
+        key, _, value = params.strip().partition("=")
+        if key == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    if accepted.get("br", 0) > 0 and _brotli() is not None:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _brotli().compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            compressible = (
+                not message.get("more_body", False)
+                and len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(_COMPRESSIBLE_PREFIXES)
+            )
+            if compressible:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                message = {**message, "body": body}
+            passthrough = True
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, create_engine, Session
-from typing import Generator
+from sqlalchemy import Connection, Engine, Integer, inspect, text
+from contextlib import contextmanager
+from typing import Callable, Generator, Iterator, Optional
 import os
 
 # SQLite for local dev, allow override for tests
@@ -8,9 +10,151 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./salon.db")
 # connect_args check_same_thread=False is needed for SQLite
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
+# Bump whenever a table or column is added/changed, and register a migration
+# below if existing rows need rewriting. init_db() skips all DDL introspection
+# while the stored version matches.
+SCHEMA_VERSION = 6
+
+# Money columns that moved from NUMERIC to integer cents in version 5
+_CENTS_COLUMNS = {
+    "fixedcosts": (
+        "rent", "utilities", "telephone", "maintenance", "advertising", "insurance",
+        "professional_fees", "receptionist_labor", "receptionist_payroll_tax", "travel",
+        "meals_entertainment", "training", "taxes_licenses", "debt_service", "postage",
+        "pos_system", "donations_promotional", "store_supplies", "office_supplies",
+        "software", "other",
+    ),
+    "costcategory": ("projected_total",),
+    "costitem": ("amount",),
+    "categorytotals": ("actual_total", "committed_paid_total"),
+    "budgetalert": ("amount", "projected_total"),
+}
+
+def _migrate_money_to_cents(conn):
+    """
+    Rewrite stored NUMERIC amounts as integer cents. Safe to run again: columns
+    already declared as integers are skipped, and since SQLite keeps the declared
+    NUMERIC type (and stores whole amounts as integers either way), converted
+    SQLite columns are recorded in money_cents_columns in the same transaction.
+    """
+    sqlite = conn.dialect.name == "sqlite"
+    converted = set()
+    if sqlite:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS money_cents_columns ("
+            "table_name VARCHAR NOT NULL, column_name VARCHAR NOT NULL, "
+            "PRIMARY KEY (table_name, column_name))"
+        ))
+        converted = {tuple(row) for row in conn.execute(text(
+            "SELECT table_name, column_name FROM money_cents_columns"
+        ))}
+
+    inspector = inspect(conn)
+    for table, columns in _CENTS_COLUMNS.items():
+        declared = {column["name"]: column["type"] for column in inspector.get_columns(table)}
+        for column in columns:
+            if isinstance(declared[column], Integer) or (table, column) in converted:
+                continue
+            if sqlite:
+                conn.execute(text(
+                    f"UPDATE {table} SET {column} = CAST(ROUND({column} * 100) AS INTEGER) "
+                    f"WHERE {column} IS NOT NULL"
+                ))
+                conn.execute(
+                    text("INSERT INTO money_cents_columns (table_name, column_name) VALUES (:t, :c)"),
+                    {"t": table, "c": column},
+                )
+            else:
+                conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+                    f"USING ROUND({column} * 100)"
+                ))
+
+def _add_open_alert_index(conn):
+    """Enforce one open alert per (category, rule); resolve duplicates left by races first."""
+    conn.execute(text(
+        "UPDATE budgetalert SET resolved_at = triggered_at "
+        "WHERE resolved_at IS NULL AND id NOT IN ("
+        "SELECT MIN(id) FROM budgetalert WHERE resolved_at IS NULL GROUP BY category_id, rule)"
+    ))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_budgetalert_open_rule "
+        "ON budgetalert (category_id, rule) WHERE resolved_at IS NULL"
+    ))
+
+# target version -> data migration run after create_all() when upgrading to it
+MIGRATIONS: dict[int, Callable] = {
+    5: _migrate_money_to_cents,
+    6: _add_open_alert_index,
+}
+
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
         yield session
 
-def init_db():
-    SQLModel.metadata.create_all(engine)
+def get_schema_version(bind: Engine) -> Optional[int]:
+    """Return the stored schema version, or None for a fresh/legacy database."""
+    with bind.connect() as conn:
+        return _read_schema_version(conn)
+
+def _read_schema_version(conn: Connection) -> Optional[int]:
+    # Check first: a missing table is OperationalError on SQLite but
+    # ProgrammingError on Postgres, where it also aborts the transaction
+    if not inspect(conn).has_table("schema_version"):
+        return None
+    return conn.execute(text("SELECT version FROM schema_version")).scalar()
+
+# Arbitrary key for the Postgres advisory lock held while migrating
+_MIGRATION_LOCK_KEY = 5_417_201
+
+@contextmanager
+def _migration_lock(bind: Engine) -> Iterator[Connection]:
+    """
+    A connection inside a write transaction that only one process holds at a
+    time, so workers booting together don't both migrate. Commits on exit.
+    """
+    with bind.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            # Wait for a slow migration in another worker instead of failing fast
+            busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+            conn.exec_driver_sql("PRAGMA busy_timeout = 300000")
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.rollback()
+                conn.exec_driver_sql(f"PRAGMA busy_timeout = {int(busy_timeout)}")
+        else:
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+            yield conn
+            conn.commit()
+
+def init_db(bind: Optional[Engine] = None):
+    """
+    Bring the schema up to SCHEMA_VERSION.
+    Fast path is a table check plus one SELECT; create_all() only runs when the version is behind.
+    The version is re-read under the migration lock, and a database already
+    stamped newer than this code (an older worker during a rollout) is left alone.
+    """
+    bind = bind or engine
+    current = get_schema_version(bind)
+    if current is not None and current >= SCHEMA_VERSION:
+        return
+
+    # Register every table on the metadata before create_all
+    import app.domain.models  # noqa: F401
+
+    with _migration_lock(bind) as conn:
+        current = _read_schema_version(conn)
+        if current is not None and current >= SCHEMA_VERSION:
+            return
+
+        SQLModel.metadata.create_all(conn)
+        for version in range((current or 0) + 1, SCHEMA_VERSION + 1):
+            migration = MIGRATIONS.get(version)
+            if migration:
+                migration(conn)
+        conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"))
+        conn.execute(text("DELETE FROM schema_version"))
+        conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {"v": SCHEMA_VERSION})
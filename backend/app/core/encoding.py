@@ -0,0 +1,143 @@
+"""
+Content negotiation for bulk endpoints.
+
+JSON stays the default. Clients sending `Accept: application/x-msgpack` get
+MessagePack instead, with two extension types:
+
+  * ext 1 - Decimal, packed as [unscaled integer, exponent] so amounts are
+    exact (Decimal("12.50") -> [1250, -2]);
+  * ext 2 - columnar table, used for any list of objects sharing the same
+    keys: {"columns": [...names], "values": [[...column 0], [...column 1], ...]};
+  * ext 3 - Decimal column whose values share one exponent, packed as
+    [exponent, [unscaled integers]] (money columns are always exponent -2).
+
+decode_msgpack() reverses both, returning plain rows with Decimal values.
+"""
+from decimal import Decimal
+from typing import Any
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+JSON_MEDIA_TYPE = "application/json"
+_MSGPACK_ALIASES = {MSGPACK_MEDIA_TYPE, "application/msgpack", "application/vnd.msgpack"}
+
+DECIMAL_EXT = 1
+TABLE_EXT = 2
+DECIMAL_COLUMN_EXT = 3
+
+def preferred_media_type(request: Request) -> str:
+    """Pick JSON or MessagePack from the Accept header; JSON wins ties."""
+    best, best_q = JSON_MEDIA_TYPE, 0.0
+    for media_range in request.headers.get("accept", "").split(","):
+        media_type, _, params = media_range.strip().partition(";")
+        media_type = media_type.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in _MSGPACK_ALIASES and q > best_q:
+            best, best_q = MSGPACK_MEDIA_TYPE, q
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*") and q >= best_q:
+            best, best_q = JSON_MEDIA_TYPE, q
+    return best
+
+def negotiate(request: Request, content: Any) -> Any:
+    """
+    Return content unchanged for JSON (FastAPI serializes it through the
+    route's response_model), or an encoded MessagePack Response.
+    """
+    if preferred_media_type(request) != MSGPACK_MEDIA_TYPE:
+        return content
+    return Response(
+        content=encode_msgpack(content),
+        media_type=MSGPACK_MEDIA_TYPE,
+        headers={"Vary": "Accept"},
+    )
+
+def encode_msgpack(content: Any) -> bytes:
+    import msgpack
+
+    return msgpack.packb(_columnar(_to_python(content)), default=_pack_ext)
+
+def decode_msgpack(data: bytes) -> Any:
+    import msgpack
+
+    return msgpack.unpackb(data, ext_hook=_unpack_ext)
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (list, tuple)):
+        return [_to_python(v) for v in value]
+    return value
+
+def _pack_ext(value: Any):
+    import msgpack
+
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError(f"Cannot encode non-finite Decimal {value}")
+        exponent = value.as_tuple().exponent
+        return msgpack.ExtType(DECIMAL_EXT, msgpack.packb([int(value.scaleb(-exponent)), exponent]))
+    if isinstance(value, _Table):
+        return msgpack.ExtType(TABLE_EXT, msgpack.packb(value.payload, default=_pack_ext))
+    if isinstance(value, _DecimalColumn):
+        return msgpack.ExtType(DECIMAL_COLUMN_EXT, msgpack.packb(value.payload))
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+def _unpack_ext(code: int, data: bytes):
+    import msgpack
+
+    if code == DECIMAL_EXT:
+        unscaled, exponent = msgpack.unpackb(data)
+        return Decimal(unscaled).scaleb(exponent)
+    if code == TABLE_EXT:
+        table = msgpack.unpackb(data, ext_hook=_unpack_ext)
+        columns = table["columns"]
+        return [dict(zip(columns, row)) for row in zip(*table["values"])]
+    if code == DECIMAL_COLUMN_EXT:
+        exponent, unscaled = msgpack.unpackb(data)
+        return [Decimal(n).scaleb(exponent) for n in unscaled]
+    return msgpack.ExtType(code, data)
+
+class _Table:
+    """Marker for a list of same-shaped dicts to be packed column by column."""
+
+    def __init__(self, rows: list[dict]):
+        columns = list(rows[0])
+        self.payload = {
+            "columns": columns,
+            "values": [_column([row[c] for row in rows]) for c in columns],
+        }
+
+class _DecimalColumn:
+    """Marker for a column of finite Decimals sharing one exponent."""
+
+    def __init__(self, exponent: int, values: list[Decimal]):
+        self.payload = [exponent, [int(v.scaleb(-exponent)) for v in values]]
+
+def _column(values: list) -> Any:
+    first = values[0]
+    if isinstance(first, Decimal) and first.is_finite():
+        exponent = first.as_tuple().exponent
+        if all(isinstance(v, Decimal) and v.is_finite() and v.as_tuple().exponent == exponent for v in values):
+            return _DecimalColumn(exponent, values)
+    if isinstance(first, (dict, list)) or any(isinstance(v, (dict, list)) for v in values):
+        return [_columnar(v) for v in values]
+    return values
+
+def _columnar(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _columnar(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(v, dict) for v in value):
+            keys = value[0].keys()
+            if all(v.keys() == keys for v in value):
+                return _Table(value)
+        return [_columnar(v) for v in value]
+    return value
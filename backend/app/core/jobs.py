@@ -0,0 +1,241 @@
+"""
+In-process background jobs for long-running computations.
+
+Jobs run on a bounded local thread pool; no external broker. The Job table
+is the source of truth for status, progress and results, so a job submitted
+through one worker can be polled or cancelled through any other. Handlers
+are registered per kind with @job_kind and report progress through their
+JobContext, which is also where cancellation is observed.
+
+Every status change is a conditional UPDATE on the expected current status,
+so a cancel racing the worker's own transitions is never lost. While a job
+is active its expires_at is a lease renewed by progress writes; a job whose
+lease lapses (its worker crashed) is marked failed by purge_expired().
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from sqlalchemy import Engine, delete, update
+from sqlmodel import Session, select
+from app.core.db import engine
+from app.domain.models import Job
+
+ACTIVE_STATUSES = ("queued", "running", "cancelling")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+class JobCancelled(Exception):
+    """Raised inside a handler once its job has been cancelled."""
+
+class JobQueueFull(Exception):
+    """Raised when the runner already has max_pending unfinished jobs."""
+
+class UnknownJobKind(Exception):
+    pass
+
+JobHandler = Callable[[dict, "JobContext"], Any]
+JOB_KINDS: dict[str, JobHandler] = {}
+
+def job_kind(name: str):
+    """Register a handler: fn(params, ctx) -> JSON-serializable result."""
+    def register(fn: JobHandler) -> JobHandler:
+        JOB_KINDS[name] = fn
+        return fn
+    return register
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class JobContext:
+    """Handed to a running handler: DB session, progress reporting, cancellation."""
+
+    # Seconds between cancellation checks when progress has not moved
+    cancel_check_interval = 0.25
+
+    def __init__(self, job_id: str, session: Session, status_session: Session, lease: timedelta):
+        self.job_id = job_id
+        self.session = session
+        self._status_session = status_session
+        self._lease = lease
+        self._last_reported = 0.0
+        self._last_checked: Optional[float] = None
+
+    def progress(self, fraction: float) -> None:
+        """
+        Record progress (0..1) and raise JobCancelled once the job is no longer
+        running (cancelled, or failed by shutdown or an expired lease).
+        Cancellation is checked on a time throttle, so a handler whose progress
+        stalls still notices it; the progress write is throttled to whole-percent steps.
+        """
+        fraction = min(max(fraction, 0.0), 1.0)
+        write = fraction - self._last_reported >= 0.01 or fraction >= 1.0
+        now = time.monotonic()
+        if (
+            not write
+            and self._last_checked is not None
+            and now - self._last_checked < self.cancel_check_interval
+        ):
+            return
+        self._last_checked = now
+        if write:
+            running = self._status_session.exec(
+                update(Job)
+                .where(Job.id == self.job_id, Job.status == "running")
+                .values(progress=round(fraction, 4), expires_at=_now() + self._lease)
+            ).rowcount == 1
+            self._last_reported = fraction
+        else:
+            status = self._status_session.exec(select(Job.status).where(Job.id == self.job_id)).first()
+            running = status == "running"
+        self._status_session.commit()
+        if not running:
+            raise JobCancelled()
+
+class JobRunner:
+    def __init__(
+        self,
+        bind: Engine,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        result_ttl: timedelta = timedelta(hours=1),
+        lease: timedelta = timedelta(hours=1),
+    ):
+        self.bind = bind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.lease = lease
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created on first submit so importing the app never spawns threads
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            return self._executor
+
+    def submit(self, kind: str, params: dict) -> Job:
+        if kind not in JOB_KINDS:
+            raise UnknownJobKind(kind)
+        self.purge_expired()
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                raise JobQueueFull()
+            job_id = uuid.uuid4().hex
+            self._pending.add(job_id)
+
+        now = _now()
+        job = Job(id=job_id, kind=kind, params=params, created_at=now, expires_at=now + self.lease)
+        with Session(self.bind) as session:
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+        self._get_executor().submit(self._run, job_id)
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a job; queued jobs stop immediately, running ones at their next progress()."""
+        with Session(self.bind) as session:
+            if not self._transition(session, job_id, ("queued",), **self._finished("cancelled")):
+                self._transition(session, job_id, ("running",), status="cancelling")
+            return session.get(Job, job_id)
+
+    def purge_expired(self) -> int:
+        """Fail active jobs whose lease lapsed, then delete expired finished jobs."""
+        now = _now()
+        with Session(self.bind) as session:
+            session.exec(
+                update(Job)
+                .where(Job.status.in_(ACTIVE_STATUSES), Job.expires_at < now)
+                .values(error="Abandoned: no progress within the job lease", **self._finished("failed"))
+            )
+            result = session.exec(delete(Job).where(Job.status.in_(FINISHED_STATUSES), Job.expires_at < now))
+            session.commit()
+            return result.rowcount
+
+    def shutdown(self) -> None:
+        """Stop the pool; jobs this process never finished are marked failed."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._lock:
+            pending, self._pending = list(self._pending), set()
+        if not pending:
+            return
+        with Session(self.bind) as session:
+            session.exec(
+                update(Job)
+                .where(Job.id.in_(pending), Job.status.in_(ACTIVE_STATUSES))
+                .values(error="Interrupted by server shutdown", **self._finished("failed"))
+            )
+            session.commit()
+
+    def _finished(self, status: str) -> dict:
+        now = _now()
+        return {"status": status, "finished_at": now, "expires_at": now + self.result_ttl}
+
+    def _transition(self, session: Session, job_id: str, expected: tuple[str, ...], **values) -> bool:
+        """Apply values only if the job is still in one of the expected statuses."""
+        result = session.exec(update(Job).where(Job.id == job_id, Job.status.in_(expected)).values(**values))
+        session.commit()
+        return result.rowcount == 1
+
+    def _run(self, job_id: str) -> None:
+        try:
+            self._execute(job_id)
+        except Exception as e:
+            # The status session itself broke; record the failure on a fresh one
+            self._fail(job_id, e)
+        finally:
+            with self._lock:
+                self._pending.discard(job_id)
+
+    def _execute(self, job_id: str) -> None:
+        with Session(self.bind) as session:
+            job = session.get(Job, job_id)
+            if job is None:
+                return
+            kind, params = job.kind, job.params
+            now = _now()
+            if not self._transition(session, job_id, ("queued",), status="running", started_at=now, expires_at=now + self.lease):
+                return
+
+            result = error = None
+            with Session(self.bind) as work_session:
+                ctx = JobContext(job_id, work_session, session, self.lease)
+                try:
+                    result = JOB_KINDS[kind](params, ctx)
+                    status = "succeeded"
+                except JobCancelled:
+                    status = "cancelled"
+                except Exception as e:
+                    status, error = "failed", str(e)[:1000]
+
+            # A failed progress write leaves the status session needing a rollback
+            session.rollback()
+            if status == "succeeded":
+                if self._transition(session, job_id, ("running",), progress=1.0, result=result, **self._finished(status)):
+                    return
+                # Cancelled after the handler's last progress() call
+                status = "cancelled"
+            self._transition(session, job_id, ACTIVE_STATUSES, error=error, **self._finished(status))
+
+    def _fail(self, job_id: str, error: Exception) -> None:
+        with Session(self.bind) as session:
+            self._transition(session, job_id, ACTIVE_STATUSES, error=str(error)[:1000], **self._finished("failed"))
+
+job_runner = JobRunner(
+    engine,
+    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+    max_pending=int(os.getenv("JOB_MAX_PENDING", "16")),
+    result_ttl=timedelta(seconds=int(os.getenv("JOB_RESULT_TTL_SECONDS", "3600"))),
+    lease=timedelta(seconds=int(os.getenv("JOB_LEASE_SECONDS", "3600"))),
+)
+
+def get_job_runner() -> JobRunner:
+    return job_runner
@@ -0,0 +1,33 @@
+"""
+Integer-cents storage for money columns.
+
+Amounts cross the model boundary as Decimal but are stored as BIGINT cents,
+so SQL aggregates (SUM, GROUP BY rollups) run in exact native integer
+arithmetic instead of SQLite's floating point NUMERIC handling.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy.types import BigInteger, TypeDecorator
+
+CENTS = Decimal("0.01")
+
+def to_cents(value) -> int:
+    """Decimal/str/int/float amount -> integer cents, rounding half up."""
+    return int((Decimal(str(value)) / CENTS).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+class Cents(TypeDecorator):
+    """Decimal money column stored as an integer number of cents."""
+    impl = BigInteger
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return Decimal
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else from_cents(value)
@@ -0,0 +1,61 @@
+"""
+Streaming XLSX helpers (openpyxl, imported lazily to keep it off startup).
+
+Writing uses openpyxl's write-only mode, which spools rows to disk as they
+are appended, then streams the finished file back in chunks. Reading uses
+read-only mode, which parses the sheet XML incrementally. Neither holds a
+whole workbook in memory.
+"""
+import os
+import tempfile
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+from fastapi.responses import StreamingResponse
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CHUNK_SIZE = 64 * 1024
+
+def stream_workbook(sheets: Iterable[tuple[str, Iterable[Iterable[Any]]]], filename: str) -> StreamingResponse:
+    """Write (title, rows) sheets to a temp file and stream it as a download."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for title, rows in sheets:
+        worksheet = workbook.create_sheet(title)
+        for row in rows:
+            worksheet.append(list(row))
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook.save(path)
+    except Exception:
+        os.unlink(path)
+        raise
+
+    def chunks() -> Iterator[bytes]:
+        try:
+            with open(path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    yield chunk
+        finally:
+            os.unlink(path)
+
+    return StreamingResponse(
+        chunks(),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+def iter_sheet_rows(file: BinaryIO, sheet_name: Optional[str] = None) -> Iterator[tuple]:
+    """Yield row value tuples from sheet_name (or the first sheet), streaming."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        if sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+        else:
+            worksheet = workbook.worksheets[0]
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
@@ -1,5 +1,14 @@
+import hashlib
 from decimal import Decimal, ROUND_HALF_UP
-from app.domain.models import OperationalInputs, FixedCosts, FinancialSnapshot, RiskFlags
+from app.domain.models import OperationalInputs, FixedCosts, FinancialSnapshot, RiskFlags, SnapshotDelta
+
+# Risk thresholds (fractions of total revenue)
+LABOR_PCT_LIMIT = 0.45
+MIN_NET_MARGIN = 0.10
+
+# Budget alert thresholds (fractions of a category's projected total)
+BUDGET_WARNING_PCT = Decimal("0.80")
+COMMITTED_STATUSES = ("committed", "paid")
 
 def calculate_forecast(inputs: OperationalInputs, costs: FixedCosts) -> FinancialSnapshot:
     """
@@ -51,8 +60,8 @@ def calculate_forecast(inputs: OperationalInputs, costs: FixedCosts) -> Financia
     # Risks
     risks = RiskFlags(
         negative_cash_flow = net_profit < 0,
-        labor_too_high = labor_pct > 0.45,
-        margin_too_low = net_margin_pct < 0.10
+        labor_too_high = labor_pct > LABOR_PCT_LIMIT,
+        margin_too_low = net_margin_pct < MIN_NET_MARGIN
     )
     
     return FinancialSnapshot(
@@ -88,6 +97,48 @@ def calculate_forecast(inputs: OperationalInputs, costs: FixedCosts) -> Financia
         risk_flags=risks
     )
 
+def evaluate_budget_rules(
+    projected_total: Decimal, actual_total: Decimal, committed_paid_total: Decimal
+) -> dict[str, Decimal]:
+    """
+    Budget rules currently breached by one category, mapped to the total that
+    breached them. Percentage rules need a positive projected total.
+    """
+    breached = {}
+    if projected_total > 0:
+        if actual_total >= projected_total * BUDGET_WARNING_PCT:
+            breached["actual_80_pct"] = actual_total
+        if actual_total >= projected_total:
+            breached["actual_100_pct"] = actual_total
+    if committed_paid_total > projected_total:
+        breached["committed_paid_over_budget"] = committed_paid_total
+    return breached
+
+def costs_version(costs: FixedCosts) -> str:
+    """
+    Content fingerprint of a FixedCosts row.
+    Snapshots computed against a different fingerprint are stale.
+    """
+    fields = costs.model_dump(exclude={"id"})
+    payload = ";".join(
+        f"{name}={_round(Decimal(str(fields[name])))}" for name in sorted(fields)
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def diff_snapshots(baseline: FinancialSnapshot, scenario: FinancialSnapshot) -> dict[str, SnapshotDelta]:
+    """Field-by-field deltas (scenario - baseline) for every numeric snapshot field."""
+    deltas = {}
+    for name, base_value in baseline:
+        if isinstance(base_value, (Decimal, float)) and not isinstance(base_value, bool):
+            value = getattr(scenario, name)
+            delta = value - base_value
+            deltas[name] = SnapshotDelta(
+                baseline=base_value,
+                scenario=value,
+                delta=round(delta, 4) if isinstance(delta, float) else delta,
+            )
+    return deltas
+
 def _round(value: Decimal) -> Decimal:
     """Helper to round currency to 2 decimal places."""
     return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -1,6 +1,9 @@
-from typing import Optional, Dict
-from sqlmodel import SQLModel, Field
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Optional, Dict, Union
+from datetime import datetime
+from sqlalchemy import Index, text
+from sqlmodel import SQLModel, Field, Column, JSON
+from pydantic import BaseModel, ConfigDict, model_validator
+from app.core.money import Cents
 from decimal import Decimal
 
 # --- Persistence Models ---
@@ -13,31 +16,31 @@ class FixedCosts(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # Occupancy
-    rent: Decimal = Field(default=Decimal("6286.70"), decimal_places=2)
-    utilities: Decimal = Field(default=Decimal("800.00"), decimal_places=2)
-    telephone: Decimal = Field(default=Decimal("250.00"), decimal_places=2)
-    maintenance: Decimal = Field(default=Decimal("300.00"), decimal_places=2)
+    rent: Decimal = Field(default=Decimal("6286.70"), decimal_places=2, sa_type=Cents)
+    utilities: Decimal = Field(default=Decimal("800.00"), decimal_places=2, sa_type=Cents)
+    telephone: Decimal = Field(default=Decimal("250.00"), decimal_places=2, sa_type=Cents)
+    maintenance: Decimal = Field(default=Decimal("300.00"), decimal_places=2, sa_type=Cents)
     
     # G&A
-    advertising: Decimal = Field(default=Decimal("1200.00"), decimal_places=2)
-    insurance: Decimal = Field(default=Decimal("200.00"), decimal_places=2)
-    professional_fees: Decimal = Field(default=Decimal("300.00"), decimal_places=2)
-    receptionist_labor: Decimal = Field(default=Decimal("1700.00"), decimal_places=2)
-    receptionist_payroll_tax: Decimal = Field(default=Decimal("170.00"), decimal_places=2)
-    travel: Decimal = Field(default=Decimal("50.00"), decimal_places=2)
-    meals_entertainment: Decimal = Field(default=Decimal("100.00"), decimal_places=2)
-    training: Decimal = Field(default=Decimal("50.00"), decimal_places=2)
-    taxes_licenses: Decimal = Field(default=Decimal("150.00"), decimal_places=2)
-    debt_service: Decimal = Field(default=Decimal("2600.00"), decimal_places=2)
-    postage: Decimal = Field(default=Decimal("25.00"), decimal_places=2)
-    pos_system: Decimal = Field(default=Decimal("300.00"), decimal_places=2)
-    donations_promotional: Decimal = Field(default=Decimal("150.00"), decimal_places=2)
-    store_supplies: Decimal = Field(default=Decimal("100.00"), decimal_places=2)
-    office_supplies: Decimal = Field(default=Decimal("100.00"), decimal_places=2)
+    advertising: Decimal = Field(default=Decimal("1200.00"), decimal_places=2, sa_type=Cents)
+    insurance: Decimal = Field(default=Decimal("200.00"), decimal_places=2, sa_type=Cents)
+    professional_fees: Decimal = Field(default=Decimal("300.00"), decimal_places=2, sa_type=Cents)
+    receptionist_labor: Decimal = Field(default=Decimal("1700.00"), decimal_places=2, sa_type=Cents)
+    receptionist_payroll_tax: Decimal = Field(default=Decimal("170.00"), decimal_places=2, sa_type=Cents)
+    travel: Decimal = Field(default=Decimal("50.00"), decimal_places=2, sa_type=Cents)
+    meals_entertainment: Decimal = Field(default=Decimal("100.00"), decimal_places=2, sa_type=Cents)
+    training: Decimal = Field(default=Decimal("50.00"), decimal_places=2, sa_type=Cents)
+    taxes_licenses: Decimal = Field(default=Decimal("150.00"), decimal_places=2, sa_type=Cents)
+    debt_service: Decimal = Field(default=Decimal("2600.00"), decimal_places=2, sa_type=Cents)
+    postage: Decimal = Field(default=Decimal("25.00"), decimal_places=2, sa_type=Cents)
+    pos_system: Decimal = Field(default=Decimal("300.00"), decimal_places=2, sa_type=Cents)
+    donations_promotional: Decimal = Field(default=Decimal("150.00"), decimal_places=2, sa_type=Cents)
+    store_supplies: Decimal = Field(default=Decimal("100.00"), decimal_places=2, sa_type=Cents)
+    office_supplies: Decimal = Field(default=Decimal("100.00"), decimal_places=2, sa_type=Cents)
     
     # Legacies / Others
-    software: Decimal = Field(default=0, decimal_places=2)
-    other: Decimal = Field(default=0, decimal_places=2)
+    software: Decimal = Field(default=0, decimal_places=2, sa_type=Cents)
+    other: Decimal = Field(default=0, decimal_places=2, sa_type=Cents)
     
     @property
     def total_monthly_fixed_costs(self) -> Decimal:
@@ -59,7 +62,7 @@ class CostCategory(SQLModel, table=True):
     """
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
-    projected_total: Decimal = Field(default=Decimal("0.00"), decimal_places=2)
+    projected_total: Decimal = Field(default=Decimal("0.00"), decimal_places=2, sa_type=Cents)
     sort_order: int = Field(default=0)
 
 class CostItem(SQLModel, table=True):
@@ -71,11 +74,72 @@ class CostItem(SQLModel, table=True):
     category_id: int = Field(foreign_key="costcategory.id")
     description: str = Field(max_length=500)
     vendor: str = Field(max_length=200)
-    amount: Decimal = Field(decimal_places=2)
+    amount: Decimal = Field(decimal_places=2, sa_type=Cents)
     status: str = Field(max_length=20)  # planned | committed | paid
     date: str  # ISO date string
     notes: Optional[str] = Field(default=None, max_length=1000)
 
+class CategoryTotals(SQLModel, table=True):
+    """
+    Running spend totals per category, adjusted by delta on every cost item
+    write so budget rules never need a full rollup.
+    """
+    category_id: int = Field(primary_key=True, foreign_key="costcategory.id")
+    actual_total: Decimal = Field(default=Decimal("0.00"), decimal_places=2, sa_type=Cents)
+    committed_paid_total: Decimal = Field(default=Decimal("0.00"), decimal_places=2, sa_type=Cents)
+
+class BudgetAlert(SQLModel, table=True):
+    """
+    A budget threshold crossed by a category.
+    At most one open (unresolved) alert exists per category and rule; it is
+    resolved when the category drops back under the threshold.
+    """
+    __table_args__ = (
+        Index(
+            "ux_budgetalert_open_rule", "category_id", "rule", unique=True,
+            sqlite_where=text("resolved_at IS NULL"),
+            postgresql_where=text("resolved_at IS NULL"),
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    category_id: int = Field(foreign_key="costcategory.id", index=True)
+    rule: str = Field(max_length=50)  # actual_80_pct | actual_100_pct | committed_paid_over_budget
+    amount: Decimal = Field(decimal_places=2, sa_type=Cents)  # running total when triggered
+    projected_total: Decimal = Field(decimal_places=2, sa_type=Cents)
+    triggered_at: datetime
+    resolved_at: Optional[datetime] = None
+
+class SavedScenario(SQLModel, table=True):
+    """
+    A named set of operational inputs with its last computed snapshot.
+    The snapshot is tagged with the FixedCosts version it was computed against
+    and is recomputed lazily once that version goes stale.
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(max_length=200, unique=True)
+    is_baseline: bool = Field(default=False)
+    inputs: dict = Field(sa_column=Column(JSON, nullable=False))
+    snapshot: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    costs_version: Optional[str] = Field(default=None, max_length=64)
+
+class Job(SQLModel, table=True):
+    """
+    A long-running computation executed by the local job runner.
+    Progress and results are persisted so any worker can serve polls.
+    """
+    id: str = Field(primary_key=True, max_length=32)
+    kind: str = Field(max_length=50)
+    status: str = Field(default="queued", max_length=20)  # queued | running | cancelling | succeeded | failed | cancelled
+    progress: float = Field(default=0.0)
+    params: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    result: Optional[Any] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = Field(default=None, max_length=1000)
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = Field(default=None, index=True)
+
 # --- Request/Response Models (Pure Pydantic) ---
 
 class OperationalInputs(BaseModel):
@@ -166,3 +230,142 @@ class ProjectCostsSummary(BaseModel):
     categories: list[CostCategorySummary]
 
     model_config = ConfigDict(coerce_numbers_to_str=True)
+
+
+class ScenarioIn(BaseModel):
+    """Create/update payload for a saved scenario."""
+    name: str
+    inputs: OperationalInputs
+    is_baseline: bool = False
+
+class ScenarioRead(BaseModel):
+    """A saved scenario with an up-to-date snapshot."""
+    id: int
+    name: str
+    is_baseline: bool
+    inputs: OperationalInputs
+    snapshot: FinancialSnapshot
+    costs_version: str
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+class SnapshotDelta(BaseModel):
+    """One snapshot field compared between a baseline and a scenario."""
+    baseline: Union[Decimal, float]
+    scenario: Union[Decimal, float]
+    delta: Union[Decimal, float]  # scenario - baseline
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+class ScenarioComparison(BaseModel):
+    """Field-by-field deltas of a scenario against a baseline."""
+    baseline_id: int
+    scenario_id: int
+    deltas: Dict[str, SnapshotDelta]
+    baseline_risk_flags: RiskFlags
+    scenario_risk_flags: RiskFlags
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+
+# /optimize scans its grid inside a request thread, so the search space is capped
+OPTIMIZER_MAX_STYLISTS = 50
+OPTIMIZER_MAX_HOURS_PER_DAY = Decimal("24")
+OPTIMIZER_MAX_GRID_POINTS = 100_000
+
+class OptimizerRequest(BaseModel):
+    """
+    Search space and constraints for the staffing/pricing optimizer.
+    base_inputs supplies rates, percentages and schedule; num_stylists,
+    stylist_hours_per_day, price_per_cut and haircuts_per_day are searched.
+    """
+    base_inputs: OperationalInputs
+    min_stylists: int = 1
+    max_stylists: int = 4
+    min_hours_per_day: Decimal = Decimal("4")
+    max_hours_per_day: Decimal = Decimal("12")
+    hours_step: Decimal = Decimal("0.5")
+    min_price_per_cut: Decimal
+    max_price_per_cut: Decimal
+    price_step: Decimal = Decimal("1.00")
+
+    # Demand: haircuts/day at min price, minus demand_drop_per_dollar per $1 above it
+    max_haircuts_per_day: int
+    demand_drop_per_dollar: Decimal = Decimal("0")
+    # Capacity: haircuts one stylist completes per hour
+    cuts_per_stylist_hour: Decimal = Decimal("2")
+
+    # Defaults to the margin_too_low threshold when omitted
+    min_net_margin: Optional[float] = None
+    # Runner-up plans within this much net profit of the optimum are returned
+    # (among the plans the search doesn't prune; see optimize_staffing)
+    tolerance: Decimal = Decimal("250.00")
+    max_alternatives: int = 5
+
+    @model_validator(mode="after")
+    def check_search_space(self) -> "OptimizerRequest":
+        if self.hours_step <= 0 or self.price_step <= 0:
+            raise ValueError("hours_step and price_step must be positive")
+        if not 1 <= self.min_stylists <= self.max_stylists <= OPTIMIZER_MAX_STYLISTS:
+            raise ValueError(f"Stylist range must be within 1..{OPTIMIZER_MAX_STYLISTS}")
+        if not 0 <= self.min_hours_per_day <= self.max_hours_per_day <= OPTIMIZER_MAX_HOURS_PER_DAY:
+            raise ValueError(f"Hours per day must be within 0..{OPTIMIZER_MAX_HOURS_PER_DAY}")
+        if not 0 <= self.min_price_per_cut <= self.max_price_per_cut:
+            raise ValueError("Price range needs 0 <= min_price_per_cut <= max_price_per_cut")
+        hour_points = int((self.max_hours_per_day - self.min_hours_per_day) / self.hours_step) + 1
+        price_points = int((self.max_price_per_cut - self.min_price_per_cut) / self.price_step) + 1
+        stylist_points = self.max_stylists - self.min_stylists + 1
+        if stylist_points * hour_points * price_points > OPTIMIZER_MAX_GRID_POINTS:
+            raise ValueError(f"Search space exceeds {OPTIMIZER_MAX_GRID_POINTS} plans; narrow the ranges or widen the steps")
+        return self
+
+class StaffingPlan(BaseModel):
+    """One feasible staffing/pricing plan."""
+    num_stylists: int
+    stylist_hours_per_day: Decimal
+    price_per_cut: Decimal
+    haircuts_per_day: int
+    net_profit: Decimal
+    net_profit_margin: float
+    labor_pct_of_sales: float
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+class OptimizationResult(BaseModel):
+    """Optimum plan (None if nothing is feasible) plus runner-ups within tolerance."""
+    best: Optional[StaffingPlan] = None
+    best_snapshot: Optional[FinancialSnapshot] = None
+    alternatives: list[StaffingPlan] = []
+    candidates_evaluated: int
+    candidates_pruned: int
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+
+class JobSubmit(BaseModel):
+    """Request to run a registered job kind in the background."""
+    kind: str
+    params: Dict[str, Any] = {}
+
+class JobStatus(BaseModel):
+    """Job state without its (possibly large) result."""
+    id: str
+    kind: str
+    status: str
+    progress: float
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+
+class PnlImportResult(BaseModel):
+    """Outcome of importing a P&L sheet."""
+    rows_read: int
+    fixed_costs_updated: list[str]
+    fixed_costs: FixedCosts
+    inputs: Optional[OperationalInputs] = None  # None unless every required input was found
+    input_errors: list[str] = []
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
@@ -0,0 +1,145 @@
+from decimal import Decimal, ROUND_FLOOR
+from app.domain.models import (
+    FixedCosts, OptimizerRequest, OptimizationResult, StaffingPlan,
+)
+from app.domain.logic import calculate_forecast, LABOR_PCT_LIMIT, MIN_NET_MARGIN, _round
+
+def optimize_staffing(request: OptimizerRequest, costs: FixedCosts) -> OptimizationResult:
+    """
+    Choose num_stylists, stylist_hours_per_day and price_per_cut to maximize
+    net profit subject to the demand cap, the labor_too_high threshold and a
+    minimum net margin.
+
+    The forecast is linear in haircuts and stylist hours, so candidates are
+    scored from precomputed coefficients instead of full forecasts, and the
+    grid is pruned:
+      * a stylist count whose best-case profit (max revenue, min hours) can't
+        reach the current best minus tolerance is skipped entirely;
+      * for a given stylist count and price, hours past the point where
+        capacity covers demand only add labor, so the hour scan stops there;
+      * for given stylists and hours, once a higher price already sells the
+        full capacity, every lower price sells the same cuts for less.
+    The pruning keeps the optimum exact, but alternatives are drawn only from
+    scanned plans: a runner-up within tolerance that the capacity or price
+    pruning skipped is never returned (it is dominated by a scanned plan with
+    the same stylist count).
+    Returned plans are re-run through calculate_forecast for exact figures.
+    """
+    if request.min_stylists < 1 or request.min_stylists > request.max_stylists:
+        raise ValueError("Stylist range must contain at least one stylist")
+    base = request.base_inputs
+    stylists = list(range(request.min_stylists, request.max_stylists + 1))
+    hours = _grid(request.min_hours_per_day, request.max_hours_per_day, request.hours_step)
+    prices = _grid(request.min_price_per_cut, request.max_price_per_cut, request.price_step)
+    min_margin = request.min_net_margin if request.min_net_margin is not None else MIN_NET_MARGIN
+
+    # --- Model coefficients ---
+    days = base.operating_days_per_month
+    keep_pct = 1 - base.royalties_pct - base.cc_fees_pct - base.ad_fund_pct
+    other_revenue = base.retail_sales + base.party_sales
+    # Everything that doesn't depend on the searched variables
+    constant = (
+        base.retail_sales * (keep_pct - base.retail_cogs_pct)
+        + base.party_sales * (keep_pct - base.party_cogs_pct)
+        - costs.total_monthly_fixed_costs
+    )
+    labor_per_stylist_hour = base.stylist_hourly_rate * days * (1 + base.stylist_payroll_tax_pct)
+
+    def demand(price: Decimal) -> int:
+        cuts = request.max_haircuts_per_day - request.demand_drop_per_dollar * (price - request.min_price_per_cut)
+        return max(0, int(cuts.to_integral_value(rounding=ROUND_FLOOR)))
+
+    def capacity(num_stylists: int, hours_per_day: Decimal) -> int:
+        cuts = num_stylists * hours_per_day * request.cuts_per_stylist_hour
+        return int(cuts.to_integral_value(rounding=ROUND_FLOOR))
+
+    demand_by_price = {price: demand(price) for price in prices}
+    best_net = None
+    feasible = []
+    evaluated = pruned = 0
+
+    for num_stylists in stylists:
+        # Upper bound: most revenue any price can earn at max hours, paying only min hours
+        peak_revenue = max(
+            price * days * min(demand_by_price[price], capacity(num_stylists, hours[-1]))
+            for price in prices
+        )
+        upper_bound = peak_revenue * keep_pct + constant - num_stylists * hours[0] * labor_per_stylist_hour
+        if best_net is not None and upper_bound < best_net - request.tolerance:
+            pruned += len(hours) * len(prices)
+            continue
+
+        capacity_bound = set()
+        for price in reversed(prices):
+            cuts_demanded = demand_by_price[price]
+            for index, hours_per_day in enumerate(hours):
+                if hours_per_day in capacity_bound:
+                    pruned += 1
+                    continue
+                cap = capacity(num_stylists, hours_per_day)
+                cuts = min(cuts_demanded, cap)
+                evaluated += 1
+
+                revenue = cuts * price * days + other_revenue
+                labor = num_stylists * hours_per_day * labor_per_stylist_hour
+                net = cuts * price * days * keep_pct + constant - labor
+                if revenue > 0:
+                    labor_pct = float(labor / revenue)
+                    margin = float(net / revenue)
+                    if labor_pct <= LABOR_PCT_LIMIT and margin >= min_margin:
+                        feasible.append((net, num_stylists, hours_per_day, price, cuts))
+                        if best_net is None or net > best_net:
+                            best_net = net
+
+                if cuts == cap:
+                    capacity_bound.add(hours_per_day)
+                if cap >= cuts_demanded:
+                    pruned += len(hours) - index - 1
+                    break
+
+    if not feasible:
+        return OptimizationResult(candidates_evaluated=evaluated, candidates_pruned=pruned)
+
+    feasible.sort(key=lambda c: (-c[0], c[1], c[2], c[3]))
+    ranked = [c for c in feasible if c[0] >= best_net - request.tolerance]
+    ranked = ranked[:request.max_alternatives + 1]
+
+    plans = []
+    best_snapshot = None
+    for _, num_stylists, hours_per_day, price, cuts in ranked:
+        inputs = base.model_copy(update={
+            "num_stylists": num_stylists,
+            "stylist_hours_per_day": hours_per_day,
+            "price_per_cut": price,
+            "haircuts_per_day": cuts,
+        })
+        snapshot = calculate_forecast(inputs, costs)
+        best_snapshot = best_snapshot or snapshot
+        plans.append(StaffingPlan(
+            num_stylists=num_stylists,
+            stylist_hours_per_day=hours_per_day,
+            price_per_cut=_round(price),
+            haircuts_per_day=cuts,
+            net_profit=snapshot.net_profit,
+            net_profit_margin=snapshot.net_profit_margin,
+            labor_pct_of_sales=snapshot.labor_pct_of_sales,
+        ))
+
+    return OptimizationResult(
+        best=plans[0],
+        best_snapshot=best_snapshot,
+        alternatives=plans[1:],
+        candidates_evaluated=evaluated,
+        candidates_pruned=pruned,
+    )
+
+def _grid(low: Decimal, high: Decimal, step: Decimal) -> list[Decimal]:
+    """Inclusive arithmetic grid from low to high."""
+    if step <= 0 or low > high:
+        raise ValueError("Search range needs step > 0 and min <= max")
+    values = []
+    value = low
+    while value <= high:
+        values.append(value)
+        value += step
+    return values
@@ -0,0 +1,92 @@
+"""
+P&L sheet layout, mirroring the "Pigtails & Crewcuts" spreadsheet:
+one label/value row per line item, grouped into sections.
+
+Export and import share the labels, so an exported sheet imports back
+unchanged. Import matching is lenient so hand-made sheets work too:
+"Meals & Entertainment", "meals_entertainment" and "MEALS/ENTERTAINMENT"
+all map to FixedCosts.meals_entertainment, and "Royalties %" maps to
+OperationalInputs.royalties_pct.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, Optional
+from app.domain.models import FixedCosts, FinancialSnapshot, OperationalInputs
+
+FIXED_COST_FIELDS = tuple(name for name in FixedCosts.model_fields if name != "id")
+INPUT_FIELDS = tuple(OperationalInputs.model_fields)
+
+_SNAPSHOT_SECTIONS = (
+    ("Revenue", ("service_revenue", "retail_revenue", "party_revenue", "total_revenue")),
+    ("Cost of Sales", (
+        "stylist_labor_cost", "labor_tax_cost", "total_labor_cost",
+        "retail_cogs", "party_cogs", "total_cogs",
+    )),
+    ("Gross Profit", ("gross_profit",)),
+    ("Variable Expenses", ("royalties", "cc_fees", "ad_fund", "total_variable_expenses")),
+)
+_SUMMARY_FIELDS = (
+    "total_monthly_fixed_costs", "total_monthly_costs", "net_profit",
+    "gross_profit_margin", "net_profit_margin", "labor_pct_of_sales",
+)
+
+def field_label(name: str) -> str:
+    """meals_entertainment -> "Meals Entertainment", royalties_pct -> "Royalties %"."""
+    label = name.replace("_", " ").title()
+    return re.sub(r" Pct$", " %", label)
+
+def normalize_label(label: Any) -> str:
+    text = str(label).strip().lower().replace("%", " pct")
+    return re.sub(r"[^a-z0-9]+", "_", text).strip("_")
+
+def pnl_rows(inputs: OperationalInputs, snapshot: FinancialSnapshot) -> list[tuple]:
+    """Rows for the P&L sheet. A one-cell row is a section header."""
+    rows = [("Operational Inputs",)]
+    rows += [(field_label(name), getattr(inputs, name)) for name in INPUT_FIELDS]
+    for title, fields in _SNAPSHOT_SECTIONS:
+        rows.append((title,))
+        rows += [(field_label(name), getattr(snapshot, name)) for name in fields]
+    rows.append(("Fixed Expenses",))
+    rows += [(field_label(name), getattr(snapshot.fixed_costs, name)) for name in FIXED_COST_FIELDS]
+    rows.append(("Summary",))
+    rows += [(field_label(name), getattr(snapshot, name)) for name in _SUMMARY_FIELDS]
+    return rows
+
+def parse_pnl_rows(rows: Iterable[Iterable[Any]]) -> tuple[dict, dict, int]:
+    """
+    Pull FixedCosts and OperationalInputs values out of P&L sheet rows.
+    Consumes rows lazily, so a streaming reader keeps memory flat.
+    Returns (fixed_costs, inputs, rows_read); unknown labels are ignored.
+    """
+    fixed_lookup = {normalize_label(name): name for name in FIXED_COST_FIELDS}
+    input_lookup = {normalize_label(name): name for name in INPUT_FIELDS}
+    fixed_costs, inputs = {}, {}
+    rows_read = 0
+    for row in rows:
+        rows_read += 1
+        cells = iter(row)
+        label = next((c for c in cells if c not in (None, "")), None)
+        if label is None:
+            continue
+        key = normalize_label(label)
+        target = fixed_costs if key in fixed_lookup else inputs if key in input_lookup else None
+        if target is None:
+            continue
+        value = next((v for v in map(_parse_number, cells) if v is not None), None)
+        if value is not None:
+            name = fixed_lookup.get(key) or input_lookup[key]
+            target[name] = value
+    return fixed_costs, inputs, rows_read
+
+def _parse_number(value: Any) -> Optional[Decimal]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value))
+    text = str(value).strip().replace(",", "").replace("$", "")
+    percent = text.endswith("%")
+    try:
+        number = Decimal(text.rstrip("%").strip())
+    except InvalidOperation:
+        return None
+    return number / 100 if percent else number
@@ -1,15 +1,20 @@
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.db import init_db
-from app.api import costs, forecast, categories, cost_items, project_summary
+from app.core.compression import CompressionMiddleware
+from app.core.jobs import get_job_runner
+from app.core.admission import AdmissionMiddleware, admission_controller
+from app.api import costs, forecast, categories, cost_items, project_summary, scenarios, optimizer, jobs, alerts, spreadsheets
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
+    # Startup: a single version check unless the schema needs upgrading
     init_db()
     yield
     # Shutdown
+    get_job_runner().shutdown()
 
 app = FastAPI(
     title="Salon Ops & Financial Forecasting API",
@@ -22,12 +27,25 @@ app = FastAPI(
 # For local dev, allow all. In prod, strict allowlist.
 origins = ["*"]
 
+# Middleware added last runs outermost.
+
+# gzip/brotli for responses above the threshold (bytes)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+)
+
+# Per-route/priority concurrency limits, 503 + Retry-After past the queue bound
+app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+
+# Outermost, so CORS headers are also set on admission rejections
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
 app.include_router(costs.router, tags=["Costs"])
@@ -35,7 +53,17 @@ app.include_router(forecast.router, tags=["Forecast"])
 app.include_router(categories.router, tags=["Categories"])
 app.include_router(cost_items.router, tags=["Cost Items"])
 app.include_router(project_summary.router, tags=["Project Summary"])
+app.include_router(scenarios.router, tags=["Scenarios"])
+app.include_router(optimizer.router, tags=["Optimizer"])
+app.include_router(jobs.router, tags=["Jobs"])
+app.include_router(alerts.router, tags=["Alerts"])
+app.include_router(spreadsheets.router, tags=["Spreadsheets"])
 
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "salon-ops-api"}
+
+@app.get("/metrics/admission")
+def admission_metrics():
+    """In-flight, queue depth, admitted and rejected counts per route and priority class."""
+    return admission_controller.metrics()
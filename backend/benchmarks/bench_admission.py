@@ -0,0 +1,88 @@
+"""
+Overload test: latency of cheap routes (/health, /costs) while a burst of
+/project-summary and /cost-items calls hits the API, with admission control
+on and off.
+
+    cd backend && python -m benchmarks.bench_admission
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+BURST = 120            # concurrent expensive requests
+CHEAP_PROBES = 60     # cheap requests issued during the burst
+NUM_CATEGORIES = 100
+ITEMS_PER_CATEGORY = 20
+
+def _seed():
+    from sqlmodel import Session
+    from app.core.db import engine, init_db
+    from app.domain.models import CostCategory, CostItem
+
+    init_db()
+    with Session(engine) as session:
+        categories = [CostCategory(name=f"Category {i}", projected_total=Decimal("10000.00"), sort_order=i)
+                      for i in range(NUM_CATEGORIES)]
+        session.add_all(categories)
+        session.commit()
+        for category in categories:
+            session.add_all(
+                CostItem(category_id=category.id, description="Line", vendor="Vendor",
+                         amount=Decimal("12.34"), status="paid", date="2024-01-01")
+                for _ in range(ITEMS_PER_CATEGORY)
+            )
+        session.commit()
+
+async def _timed_get(client, path):
+    start = time.perf_counter()
+    resp = await client.get(path)
+    return resp.status_code, time.perf_counter() - start
+
+async def _run(app):
+    from httpx import AsyncClient, ASGITransport
+
+    # Errors (e.g. DB pool timeouts under overload) come back as 500s instead of raising
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        burst = [
+            asyncio.create_task(_timed_get(client, "/project-summary" if i % 2 else "/cost-items"))
+            for i in range(BURST)
+        ]
+        await asyncio.sleep(0.05)
+        cheap = []
+        for i in range(CHEAP_PROBES):
+            cheap.append(asyncio.create_task(_timed_get(client, "/health" if i % 2 else "/costs")))
+            await asyncio.sleep(0.01)
+        cheap = await asyncio.gather(*cheap)
+        expensive = await asyncio.gather(*burst)
+    return cheap, expensive
+
+def _p(latencies, pct):
+    return statistics.quantiles(latencies, n=100)[pct - 1] * 1000 if len(latencies) > 1 else 0.0
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+        _seed()
+        from app.main import app
+        from app.core.admission import admission_controller
+
+        print(f"{'admission':<10} {'cheap p50':>10} {'cheap p99':>10} {'cheap err':>10} {'bulk ok':>8} {'bulk 503':>9} {'bulk err':>9}")
+        for enabled in (False, True):
+            admission_controller.enabled = enabled
+            cheap, expensive = asyncio.run(_run(app))
+            latencies = [t for _, t in cheap]
+            cheap_errors = sum(1 for status, _ in cheap if status != 200)
+            ok = sum(1 for status, _ in expensive if status == 200)
+            shed = sum(1 for status, _ in expensive if status == 503)
+            errors = len(expensive) - ok - shed
+            print(
+                f"{'on' if enabled else 'off':<10} {_p(latencies, 50):>8.1f}ms {_p(latencies, 99):>8.1f}ms "
+                f"{cheap_errors:>10} {ok:>8} {shed:>9} {errors:>9}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Payload size and encode time per response format for bulk outputs:
+a /cost-items listing and a ProjectCostsSummary with many categories.
+
+    cd backend && python -m benchmarks.bench_formats
+"""
+import time
+from decimal import Decimal
+from pydantic import TypeAdapter
+from app.core.compression import compress, _brotli
+from app.core.encoding import encode_msgpack
+from app.domain.models import CostCategory, CostItem, CostCategorySummary, ProjectCostsSummary
+
+NUM_ITEMS = 20_000
+NUM_CATEGORIES = 500
+REPEATS = 5
+
+def _cost_items() -> list[CostItem]:
+    return [
+        CostItem(
+            id=i, category_id=i % NUM_CATEGORIES + 1, description=f"Invoice line {i}",
+            vendor=f"Vendor {i % 37}", amount=(Decimal(i % 100_000) / 100 + Decimal("10.00")).quantize(Decimal("0.01")),
+            status=("planned", "committed", "paid")[i % 3], date="2024-03-15",
+        )
+        for i in range(NUM_ITEMS)
+    ]
+
+def _summary() -> ProjectCostsSummary:
+    categories = [
+        CostCategorySummary(
+            category=CostCategory(id=i, name=f"Category {i}", projected_total=Decimal("5000.00"), sort_order=i),
+            actual_total=Decimal("4321.09"), variance=Decimal("678.91"), variance_pct=0.1358,
+        )
+        for i in range(NUM_CATEGORIES)
+    ]
+    return ProjectCostsSummary(
+        total_projected=Decimal("2500000.00"), total_actual=Decimal("2160545.00"),
+        remaining_budget=Decimal("339455.00"), variance=Decimal("339455.00"), categories=categories,
+    )
+
+def _timed(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def _report(label: str, payload, adapter: TypeAdapter):
+    encoders = {
+        "json": lambda: adapter.dump_json(payload),
+        "msgpack": lambda: encode_msgpack(payload),
+    }
+    codecs = [None, "gzip"] + (["br"] if _brotli() else [])
+    print(f"\n{label}")
+    print(f"{'format':<16} {'bytes':>12} {'encode (ms)':>12}")
+    for name, encode in encoders.items():
+        body, encode_s = _timed(encode)
+        for codec in codecs:
+            if codec:
+                out, codec_s = _timed(lambda: compress(body, codec))
+            else:
+                out, codec_s = body, 0.0
+            fmt = name if codec is None else f"{name}+{codec}"
+            print(f"{fmt:<16} {len(out):>12,} {(encode_s + codec_s) * 1000:>12.1f}")
+
+def main():
+    _report(f"/cost-items ({NUM_ITEMS:,} items)", _cost_items(), TypeAdapter(list[CostItem]))
+    _report(f"/project-summary ({NUM_CATEGORIES} categories)", _summary(), TypeAdapter(ProjectCostsSummary))
+
+if __name__ == "__main__":
+    main()
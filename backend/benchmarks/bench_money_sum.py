@@ -0,0 +1,82 @@
+"""
+SUM / GROUP BY aggregation over 1M cost item amounts: legacy NUMERIC
+columns (floating point on SQLite) vs integer-cents columns.
+
+    cd backend && python -m benchmarks.bench_money_sum
+"""
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+from sqlalchemy import Column, Integer, MetaData, Numeric, Table, create_engine, func, select
+from app.core.money import Cents, to_cents
+
+NUM_ITEMS = 1_000_000
+NUM_CATEGORIES = 200
+REPEATS = 3
+
+def _tables(metadata: MetaData):
+    numeric = Table(
+        "numeric_item", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("category_id", Integer, index=True),
+        Column("amount", Numeric(scale=2)),
+    )
+    cents = Table(
+        "cents_item", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("category_id", Integer, index=True),
+        Column("amount", Cents),
+    )
+    return numeric, cents
+
+def _best(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def main():
+    rng = random.Random(42)
+    amounts = [Decimal(rng.randint(1, 500_000)).scaleb(-2) for _ in range(NUM_ITEMS)]
+    categories = [i % NUM_CATEGORIES for i in range(NUM_ITEMS)]
+    expected = sum(amounts)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        metadata = MetaData()
+        numeric, cents = _tables(metadata)
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            # Bypass per-row type processing so loading isn't what gets measured
+            conn.exec_driver_sql(
+                "INSERT INTO numeric_item (category_id, amount) VALUES (?, ?)",
+                [(c, float(a)) for c, a in zip(categories, amounts)],
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO cents_item (category_id, amount) VALUES (?, ?)",
+                [(c, to_cents(a)) for c, a in zip(categories, amounts)],
+            )
+
+        print(f"{NUM_ITEMS:,} items, exact total {expected}")
+        print(f"{'storage':<10} {'SUM (ms)':>10} {'GROUP BY (ms)':>14} {'raw SQL SUM':>22} {'total':>16} {'exact':>6}")
+        with engine.connect() as conn:
+            for name, table in (("numeric", numeric), ("cents", cents)):
+                total, sum_s = _best(lambda: conn.execute(select(func.sum(table.c.amount))).scalar())
+                rows, group_s = _best(lambda: conn.execute(
+                    select(table.c.category_id, func.sum(table.c.amount)).group_by(table.c.category_id)
+                ).all())
+                group_total = sum(Decimal(str(r[1])) for r in rows)
+                exact = total == expected and group_total == expected
+                # What the database itself computed, before Decimal conversion
+                raw = conn.exec_driver_sql(f"SELECT SUM(amount) FROM {table.name}").scalar()
+                print(
+                    f"{name:<10} {sum_s * 1000:>10.1f} {group_s * 1000:>14.1f} "
+                    f"{raw!r:>22} {str(total):>16} {str(exact):>6}"
+                )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Cold-start benchmark: import time of app.main and time-to-first-request.
+
+Each measurement runs in a fresh interpreter so module caches don't leak
+between runs. "cold" boots against an empty database (schema gets created),
+"warm" boots against one whose schema version is already current.
+
+    cd backend && python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 5
+
+_PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+from app.main import app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    client.get("/health")
+t2 = time.perf_counter()
+print(json.dumps({"import_s": t1 - t0, "first_request_s": t2 - t0}))
+"""
+
+def _probe(database_url: str) -> dict:
+    env = {**os.environ, "DATABASE_URL": database_url}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env, capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    results = {"cold": [], "warm": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(RUNS):
+            url = f"sqlite:///{tmp}/bench_{i}.db"
+            results["cold"].append(_probe(url))
+            results["warm"].append(_probe(url))
+
+    print(f"{'boot':<6} {'import (ms)':>12} {'first request (ms)':>20}")
+    for name, runs in results.items():
+        imp = statistics.median(r["import_s"] for r in runs) * 1000
+        ttfr = statistics.median(r["first_request_s"] for r in runs) * 1000
+        print(f"{name:<6} {imp:>12.1f} {ttfr:>20.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from app.core.admission import (
+    AdmissionController, AdmissionMiddleware, AdmissionRule, Limiter, PriorityClass, admission_controller,
+)
+from app.main import app as main_app
+
+def _build_app():
+    controller = AdmissionController(
+        rules=(
+            AdmissionRule("/cheap", "critical"),
+            AdmissionRule("/slow", "bulk", max_concurrency=1, max_queue=1),
+        ),
+        classes=(
+            PriorityClass("critical"),
+            PriorityClass("bulk", max_concurrency=4, max_queue=4, queue_timeout=5.0),
+        ),
+        retry_after=2,
+    )
+    release = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @app.get("/slow")
+    async def slow():
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/cheap")
+    async def cheap():
+        return {"ok": True}
+
+    return app, controller, release
+
+@pytest.mark.asyncio
+async def test_overload_is_shed_with_retry_after():
+    app, controller, release = _build_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        running = asyncio.create_task(ac.get("/slow"))
+        queued = asyncio.create_task(ac.get("/slow"))
+        await asyncio.sleep(0.05)
+
+        # One in flight, one queued: the third is rejected right away
+        resp = await ac.get("/slow")
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "2"
+
+        # Cheap routes are not held up by the saturated bulk route
+        assert (await ac.get("/cheap")).status_code == 200
+
+        stats = controller.metrics()["routes"]["/slow"]
+        assert stats["in_flight"] == 1
+        assert stats["queue_depth"] == 1
+        assert stats["rejected"] == 1
+
+        release.set()
+        assert (await running).status_code == 200
+        assert (await queued).status_code == 200
+
+    stats = controller.metrics()["routes"]["/slow"]
+    assert stats["in_flight"] == 0
+    assert stats["admitted"] == 2
+    assert controller.metrics()["classes"]["bulk"]["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_rejections_carry_cors_headers(monkeypatch):
+    # A browser on another origin must see the 503 and be able to read Retry-After
+    full = Limiter("/project-summary", max_concurrency=1, max_queue=0, queue_timeout=0.1)
+    await full.acquire()
+    monkeypatch.setattr(admission_controller, "limiters_for", lambda method, path: [full])
+
+    async with AsyncClient(transport=ASGITransport(app=main_app), base_url="http://test") as ac:
+        resp = await ac.get("/project-summary", headers={"Origin": "http://localhost:5173"})
+
+    assert resp.status_code == 503
+    assert resp.headers["access-control-allow-origin"] in ("*", "http://localhost:5173")
+    assert "retry-after" in resp.headers["access-control-expose-headers"].lower()
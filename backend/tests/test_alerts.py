@@ -0,0 +1,115 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+import base64
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from app.api.alerts import item_state, record_item_change
+from app.domain.models import BudgetAlert, CategoryTotals, CostCategory, CostItem
+
+def get_auth_headers(username="admin", password="password"):
+    credentials = f"{username}:{password}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+def _item(category_id, amount, status):
+    return {
+        "category_id": category_id, "description": "Line", "vendor": "Acme",
+        "amount": amount, "status": status, "date": "2024-01-01",
+    }
+
+async def _open_rules(ac, auth, category_id):
+    resp = await ac.get("/alerts", params={"category_id": category_id}, headers=auth)
+    assert resp.status_code == 200
+    return sorted(a["rule"] for a in resp.json())
+
+@pytest.mark.asyncio
+async def test_alerts_follow_cost_item_writes(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        cat = (await ac.post("/categories", json={"name": "Build-out", "projected_total": "1000.00"}, headers=auth)).json()
+
+        await ac.post("/cost-items", json=_item(cat["id"], "500.00", "planned"), headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == []
+
+        # 850 of 1000 spent
+        second = (await ac.post("/cost-items", json=_item(cat["id"], "350.00", "committed"), headers=auth)).json()
+        assert await _open_rules(ac, auth, cat["id"]) == ["actual_80_pct"]
+
+        # Repeated writes above the same threshold don't duplicate the alert
+        await ac.post("/cost-items", json=_item(cat["id"], "10.00", "planned"), headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == ["actual_80_pct"]
+
+        # Committed 350 -> 1200 puts committed+paid over budget and actual past 100%
+        await ac.put(f"/cost-items/{second['id']}", json=_item(cat["id"], "1200.00", "paid"), headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == [
+            "actual_100_pct", "actual_80_pct", "committed_paid_over_budget",
+        ]
+
+        # Removing it resolves everything
+        await ac.delete(f"/cost-items/{second['id']}", headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == []
+        resp = await ac.get("/alerts", params={"include_resolved": True}, headers=auth)
+        assert len(resp.json()) == 3
+        assert all(a["resolved_at"] for a in resp.json())
+
+@pytest.mark.asyncio
+async def test_alerts_follow_budget_changes(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        cat = (await ac.post("/categories", json={"name": "Signage", "projected_total": "1000.00"}, headers=auth)).json()
+        await ac.post("/cost-items", json=_item(cat["id"], "600.00", "paid"), headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == []
+
+        # Shrinking the budget is enough to cross thresholds
+        await ac.put(f"/categories/{cat['id']}", json={"name": "Signage", "projected_total": "500.00"}, headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == [
+            "actual_100_pct", "actual_80_pct", "committed_paid_over_budget",
+        ]
+
+        await ac.delete(f"/categories/{cat['id']}", headers=auth)
+        assert await _open_rules(ac, auth, cat["id"]) == []
+
+def test_overlapping_writes_do_not_lose_updates(session):
+    category = CostCategory(name="Build-out", projected_total=Decimal("1000.00"))
+    session.add(category)
+    session.commit()
+    item = CostItem(
+        category_id=category.id, description="Line", vendor="Acme",
+        amount=Decimal("1.00"), status="planned", date="2024-01-01",
+    )
+    session.add(item)
+    record_item_change(session, None, item_state(item))
+    session.commit()
+
+    with Session(session.get_bind()) as other:
+        # Both writers have read the totals before either one writes
+        stale = other.get(CategoryTotals, category.id)
+        assert stale.actual_total == Decimal("1.00")
+        record_item_change(session, None, (category.id, Decimal("100.00"), "planned"))
+        session.commit()
+        record_item_change(other, None, (category.id, Decimal("200.00"), "planned"))
+        other.commit()
+
+    totals = session.get(CategoryTotals, category.id, populate_existing=True)
+    assert totals.actual_total == Decimal("301.00")
+
+def test_one_open_alert_per_category_and_rule(session):
+    category = CostCategory(name="Signage", projected_total=Decimal("100.00"))
+    session.add(category)
+    session.commit()
+
+    def alert(resolved_at=None):
+        return BudgetAlert(
+            category_id=category.id, rule="actual_80_pct", amount=Decimal("90.00"),
+            projected_total=Decimal("100.00"), triggered_at=datetime(2024, 1, 1), resolved_at=resolved_at,
+        )
+
+    session.add(alert(resolved_at=datetime(2024, 1, 2)))
+    session.add(alert())
+    session.commit()
+
+    session.add(alert())
+    with pytest.raises(IntegrityError):
+        session.commit()
@@ -0,0 +1,144 @@
+import threading
+import time
+from decimal import Decimal
+from sqlmodel import SQLModel, Session, create_engine, select, func
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, inspect, text
+from app.core import db
+from app.core.db import init_db, get_schema_version, SCHEMA_VERSION
+from app.domain.models import CostCategory, CostItem
+
+def test_init_db_stamps_schema_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/fresh.db")
+    assert get_schema_version(engine) is None
+
+    init_db(engine)
+
+    assert get_schema_version(engine) == SCHEMA_VERSION
+    assert "fixedcosts" in inspect(engine).get_table_names()
+
+def test_init_db_skips_create_all_when_current(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/current.db")
+    init_db(engine)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("create_all should not run on a current schema")
+    monkeypatch.setattr(SQLModel.metadata, "create_all", fail)
+
+    init_db(engine)
+
+def test_init_db_runs_pending_migrations(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    SQLModel.metadata.create_all(engine)  # pre-versioning database
+    ran = []
+    monkeypatch.setattr(db, "MIGRATIONS", {SCHEMA_VERSION: lambda conn: ran.append(SCHEMA_VERSION)})
+
+    init_db(engine)
+
+    assert ran == [SCHEMA_VERSION]
+    assert get_schema_version(engine) == SCHEMA_VERSION
+
+def test_concurrent_boots_migrate_once(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path}/race.db"
+    SQLModel.metadata.create_all(create_engine(url))  # pre-versioning database
+    ran = []
+
+    def slow_migration(conn):
+        ran.append(SCHEMA_VERSION)
+        time.sleep(0.2)
+    monkeypatch.setattr(db, "MIGRATIONS", {SCHEMA_VERSION: slow_migration})
+
+    # One engine per thread, like separate worker processes
+    workers = [threading.Thread(target=init_db, args=(create_engine(url),)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert ran == [SCHEMA_VERSION]
+    assert get_schema_version(create_engine(url)) == SCHEMA_VERSION
+
+def test_init_db_leaves_newer_schema_alone(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/newer.db")
+    init_db(engine)
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE schema_version SET version = :v"), {"v": SCHEMA_VERSION + 1})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("create_all should not run on a newer schema")
+    monkeypatch.setattr(SQLModel.metadata, "create_all", fail)
+
+    init_db(engine)
+
+    assert get_schema_version(engine) == SCHEMA_VERSION + 1
+
+def test_money_is_stored_as_integer_cents(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/cents.db")
+    init_db(engine)
+    with Session(engine) as session:
+        category = CostCategory(name="Build-out", projected_total=Decimal("1000.00"))
+        session.add(category)
+        session.commit()
+        for _ in range(1000):
+            session.add(CostItem(
+                category_id=category.id, description="Line", vendor="Acme",
+                amount=Decimal("0.10"), status="paid", date="2024-01-01",
+            ))
+        session.commit()
+
+        total = session.exec(select(func.sum(CostItem.amount))).one()
+        assert total == Decimal("100.00")
+        assert str(total) == "100.00"
+
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT typeof(amount), amount FROM costitem LIMIT 1")).one()
+    assert tuple(row) == ("integer", 10)
+
+def _legacy_money_engine(path):
+    """A version 4 database: costcategory declares NUMERIC money holding plain amounts."""
+    engine = create_engine(f"sqlite:///{path}")
+    metadata = MetaData()
+    Table(
+        "costcategory", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(200), nullable=False),
+        Column("projected_total", Numeric(12, 2)),
+        Column("sort_order", Integer, nullable=False),
+    )
+    metadata.create_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE schema_version (version INTEGER NOT NULL)"))
+        conn.execute(text("INSERT INTO schema_version (version) VALUES (4)"))
+    return engine
+
+def test_legacy_numeric_money_is_migrated_to_cents(tmp_path):
+    engine = _legacy_money_engine(tmp_path / "legacy_money.db")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO costcategory (name, projected_total, sort_order) VALUES ('Signage', 1500.5, 0)"
+        ))
+
+    init_db(engine)
+
+    with Session(engine) as session:
+        category = session.exec(select(CostCategory)).one()
+        assert category.projected_total == Decimal("1500.50")
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT projected_total FROM costcategory")).scalar() == 150050
+
+def test_money_migration_is_safe_to_run_twice(tmp_path):
+    engine = _legacy_money_engine(tmp_path / "legacy_twice.db")
+    with engine.begin() as conn:
+        # Whole amounts are stored as SQLite integers even in a NUMERIC column
+        conn.execute(text(
+            "INSERT INTO costcategory (name, projected_total, sort_order) "
+            "VALUES ('Paint', 1500, 0), ('Signage', 1500.5, 1)"
+        ))
+
+    init_db(engine)
+    with engine.begin() as conn:
+        db._migrate_money_to_cents(conn)
+
+    with engine.connect() as conn:
+        values = conn.execute(text("SELECT projected_total FROM costcategory ORDER BY id")).scalars().all()
+    assert values == [150000, 150050]
@@ -0,0 +1,68 @@
+import pytest
+from decimal import Decimal
+from httpx import AsyncClient, ASGITransport
+import base64
+from app.core.encoding import encode_msgpack, decode_msgpack, MSGPACK_MEDIA_TYPE
+from app.domain.models import CostCategory, CostItem
+
+def get_auth_headers(username="admin", password="password"):
+    credentials = f"{username}:{password}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+def _seed(session, count=50):
+    category = CostCategory(name="Build-out", projected_total=Decimal("10000.00"))
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+    for i in range(count):
+        session.add(CostItem(
+            category_id=category.id, description=f"Item {i}", vendor="Acme",
+            amount=Decimal("123.45"), status="paid", date="2024-01-01",
+        ))
+    session.commit()
+
+def test_msgpack_round_trip_is_exact():
+    rows = [{"id": i, "amount": Decimal("0.10") * i, "tags": {"a": Decimal("-1.05")}} for i in range(3)]
+    decoded = decode_msgpack(encode_msgpack({"items": rows, "total": Decimal("0.30")}))
+
+    assert decoded["items"] == rows
+    assert decoded["total"] == Decimal("0.30")
+    assert str(decoded["items"][1]["amount"]) == "0.10"
+
+@pytest.mark.asyncio
+async def test_cost_items_content_negotiation(client, session):
+    _seed(session)
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        json_resp = await ac.get("/cost-items", headers=auth)
+        assert json_resp.headers["content-type"] == "application/json"
+
+        resp = await ac.get("/cost-items", headers={**auth, "Accept": MSGPACK_MEDIA_TYPE})
+        assert resp.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        items = decode_msgpack(resp.content)
+        assert len(items) == 50
+        assert items[0]["amount"] == Decimal("123.45")
+        assert len(resp.content) < len(json_resp.content)
+
+@pytest.mark.asyncio
+async def test_compression_above_threshold(client, session):
+    _seed(session)
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        resp = await ac.get("/cost-items", headers={**auth, "Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()) == 50
+
+        # Small bodies are left alone
+        resp = await ac.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+@pytest.mark.asyncio
+async def test_project_summary_msgpack(client, session):
+    _seed(session, count=3)
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        resp = await ac.get("/project-summary", headers={**get_auth_headers(), "Accept": MSGPACK_MEDIA_TYPE})
+    summary = decode_msgpack(resp.content)
+    assert summary["total_actual"] == Decimal("370.35")
+    assert summary["categories"][0]["category"]["name"] == "Build-out"
@@ -0,0 +1,183 @@
+import time
+import threading
+import pytest
+from decimal import Decimal
+from datetime import datetime, timedelta
+from httpx import AsyncClient, ASGITransport
+import base64
+from sqlmodel import Session, update
+from app.api.jobs import LEDGER_EXPORT_BATCH
+from app.core.jobs import JobRunner, JobQueueFull, job_kind, get_job_runner
+from app.domain.models import CostCategory, CostItem, Job
+
+def get_auth_headers(username="admin", password="password"):
+    credentials = f"{username}:{password}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+release = threading.Event()
+
+@job_kind("test_wait")
+def run_test_wait(params, ctx):
+    while not release.wait(0.01):
+        ctx.progress(0.5)
+    return {"ok": True}
+
+def _wait_for(runner, job_id, statuses, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with Session(runner.bind) as session:
+            job = session.get(Job, job_id)
+            if job.status in statuses:
+                return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {statuses}")
+
+@pytest.fixture(name="runner")
+def runner_fixture(session):
+    release.clear()
+    runner = JobRunner(session.get_bind(), max_workers=1, max_pending=2)
+    yield runner
+    release.set()
+    runner.shutdown()
+
+def test_job_runs_and_persists_result(runner):
+    job = runner.submit("test_wait", {})
+    release.set()
+    job = _wait_for(runner, job.id, ("succeeded",))
+
+    assert job.result == {"ok": True}
+    assert job.progress == 1.0
+    assert job.expires_at is not None
+
+def test_running_job_can_be_cancelled(runner):
+    job = runner.submit("test_wait", {})
+    _wait_for(runner, job.id, ("running",))
+
+    assert runner.cancel(job.id).status == "cancelling"
+    job = _wait_for(runner, job.id, ("cancelled",))
+    assert job.result is None
+
+def test_ledger_export_spanning_several_batches(runner, session):
+    category = CostCategory(name="Build-out", projected_total=Decimal("1000.00"))
+    session.add(category)
+    session.commit()
+    count = LEDGER_EXPORT_BATCH * 2 + 5
+    session.add_all(
+        CostItem(
+            category_id=category.id, description=f"Item {i}", vendor="Acme",
+            amount=Decimal("1.00"), status="paid", date="2024-01-01",
+        )
+        for i in range(count)
+    )
+    session.commit()
+
+    job = runner.submit("ledger_export", {})
+    job = _wait_for(runner, job.id, ("succeeded", "failed"), timeout=10.0)
+
+    assert job.status == "succeeded", job.error
+    assert len(job.result) == count
+    assert [row["id"] for row in job.result] == sorted(row["id"] for row in job.result)
+
+def test_job_is_failed_when_status_write_breaks(runner, monkeypatch):
+    finished = JobRunner._finished
+    broken = []
+
+    def finished_once_broken(self, status):
+        if status == "succeeded" and not broken:
+            broken.append(status)
+            raise RuntimeError("status write failed")
+        return finished(self, status)
+    monkeypatch.setattr(JobRunner, "_finished", finished_once_broken)
+
+    release.set()
+    job = _wait_for(runner, runner.submit("test_wait", {}).id, ("failed",))
+
+    assert "status write failed" in job.error
+    assert job.expires_at is not None
+
+def _wait_idle(runner, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while runner._pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+def test_cancelled_job_is_never_overwritten(runner):
+    running = runner.submit("test_wait", {})
+    queued = runner.submit("test_wait", {})
+    _wait_for(runner, running.id, ("running",))
+    # What a cancel racing the worker's queued -> running transition used to leave behind
+    with Session(runner.bind) as session:
+        session.exec(update(Job).where(Job.id == running.id).values(status="cancelled"))
+        session.commit()
+    assert runner.cancel(queued.id).status == "cancelled"
+
+    release.set()
+    _wait_idle(runner)
+
+    with Session(runner.bind) as session:
+        for job_id in (running.id, queued.id):
+            job = session.get(Job, job_id)
+            assert job.status == "cancelled"
+            assert job.result is None
+
+def test_orphaned_active_jobs_are_failed_when_their_lease_lapses(runner, session):
+    # Left running by a worker that crashed
+    session.add(Job(
+        id="orphan", kind="test_wait", status="running", created_at=datetime(2024, 1, 1),
+        expires_at=datetime(2024, 1, 1, 1),
+    ))
+    session.commit()
+
+    assert runner.purge_expired() == 0
+
+    job = session.get(Job, "orphan", populate_existing=True)
+    assert job.status == "failed"
+    assert "lease" in job.error
+    assert job.expires_at > datetime.utcnow()
+
+def test_queue_is_bounded(runner):
+    runner.submit("test_wait", {})
+    queued = runner.submit("test_wait", {})
+    with pytest.raises(JobQueueFull):
+        runner.submit("test_wait", {})
+
+    # Queued jobs are cancelled without ever running
+    assert runner.cancel(queued.id).status == "cancelled"
+
+def test_expired_results_are_purged(session):
+    runner = JobRunner(session.get_bind(), result_ttl=timedelta(seconds=-1))
+    release.set()
+    job = runner.submit("test_wait", {})
+    _wait_for(runner, job.id, ("succeeded",))
+
+    assert runner.purge_expired() == 1
+    runner.shutdown()
+
+@pytest.mark.asyncio
+async def test_rollup_rebuild_job_endpoints(client, session, runner):
+    category = CostCategory(name="Build-out", projected_total=Decimal("1000.00"))
+    session.add(category)
+    session.commit()
+    session.add(CostItem(
+        category_id=category.id, description="Paint", vendor="Acme",
+        amount=Decimal("250.00"), status="paid", date="2024-01-01",
+    ))
+    session.commit()
+    client.dependency_overrides[get_job_runner] = lambda: runner
+
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        resp = await ac.post("/jobs", json={"kind": "rollup_rebuild"}, headers=auth)
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+
+        resp = await ac.get(f"/jobs/{job_id}/events", headers=auth)
+        events = [line for line in resp.text.splitlines() if line.startswith("data: ")]
+        assert '"status":"succeeded"' in events[-1]
+
+        resp = await ac.get(f"/jobs/{job_id}/result", headers=auth)
+        assert resp.status_code == 200
+        assert resp.json()["total_actual"] == "250.00"
+
+        resp = await ac.post("/jobs", json={"kind": "nope"}, headers=auth)
+        assert resp.status_code == 422
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from app.domain.models import OperationalInputs, FixedCosts
-from app.domain.logic import calculate_forecast
+from app.domain.logic import calculate_forecast, evaluate_budget_rules
 
 def test_calculate_forecast_basic():
     """
@@ -90,3 +90,16 @@ def test_zero_revenue_case():
     # Rent = 1000.
     # Expected profit = -6280.
     assert snapshot.net_profit == Decimal("-6280.00")
+
+def test_evaluate_budget_rules():
+    assert evaluate_budget_rules(Decimal("1000.00"), Decimal("799.99"), Decimal("0")) == {}
+    assert evaluate_budget_rules(Decimal("1000.00"), Decimal("800.00"), Decimal("0")) == {
+        "actual_80_pct": Decimal("800.00"),
+    }
+    assert set(evaluate_budget_rules(Decimal("1000.00"), Decimal("1000.00"), Decimal("1000.01"))) == {
+        "actual_80_pct", "actual_100_pct", "committed_paid_over_budget",
+    }
+    # No budget: only committed spend can breach it
+    assert evaluate_budget_rules(Decimal("0.00"), Decimal("50.00"), Decimal("50.00")) == {
+        "committed_paid_over_budget": Decimal("50.00"),
+    }
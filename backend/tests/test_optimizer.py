@@ -0,0 +1,113 @@
+import base64
+import pytest
+from decimal import Decimal
+from itertools import product
+from httpx import AsyncClient, ASGITransport
+from pydantic import ValidationError
+from app.domain.models import OperationalInputs, FixedCosts, OptimizerRequest, OPTIMIZER_MAX_GRID_POINTS
+from app.domain.logic import calculate_forecast
+from app.domain.optimizer import optimize_staffing, _grid
+
+def _request(**overrides):
+    params = dict(
+        base_inputs=OperationalInputs(
+            operating_days_per_month=30,
+            haircuts_per_day=0,
+            price_per_cut=Decimal("30.00"),
+            stylist_hours_per_day=Decimal("8"),
+            stylist_hourly_rate=Decimal("18.00"),
+            retail_sales=Decimal("1500.00"),
+        ),
+        min_stylists=1,
+        max_stylists=4,
+        min_hours_per_day=Decimal("4"),
+        max_hours_per_day=Decimal("10"),
+        hours_step=Decimal("0.5"),
+        min_price_per_cut=Decimal("25.00"),
+        max_price_per_cut=Decimal("45.00"),
+        max_haircuts_per_day=40,
+        demand_drop_per_dollar=Decimal("1.2"),
+        cuts_per_stylist_hour=Decimal("2"),
+        min_net_margin=0.05,
+    )
+    params.update(overrides)
+    return OptimizerRequest(**params)
+
+def _brute_force(request, costs):
+    """Exhaustive search through calculate_forecast, for cross-checking."""
+    best = None
+    hours = _grid(request.min_hours_per_day, request.max_hours_per_day, request.hours_step)
+    prices = _grid(request.min_price_per_cut, request.max_price_per_cut, request.price_step)
+    for s, h, p in product(range(request.min_stylists, request.max_stylists + 1), hours, prices):
+        demand = int(request.max_haircuts_per_day - request.demand_drop_per_dollar * (p - request.min_price_per_cut))
+        cuts = max(0, min(demand, int(s * h * request.cuts_per_stylist_hour)))
+        inputs = request.base_inputs.model_copy(update={
+            "num_stylists": s, "stylist_hours_per_day": h, "price_per_cut": p, "haircuts_per_day": cuts,
+        })
+        snap = calculate_forecast(inputs, costs)
+        if snap.risk_flags.labor_too_high or snap.net_profit_margin < request.min_net_margin:
+            continue
+        if best is None or snap.net_profit > best.net_profit:
+            best = snap
+    return best
+
+def test_optimizer_matches_brute_force():
+    costs = FixedCosts(rent=Decimal("3000.00"))
+    request = _request()
+
+    result = optimize_staffing(request, costs)
+    expected = _brute_force(request, costs)
+
+    assert result.best is not None
+    assert result.best.net_profit == expected.net_profit
+    assert result.best_snapshot.net_profit == result.best.net_profit
+    assert not result.best_snapshot.risk_flags.labor_too_high
+    assert result.candidates_pruned > 0
+
+def test_optimizer_alternatives_within_tolerance():
+    request = _request(tolerance=Decimal("500.00"), max_alternatives=3)
+    result = optimize_staffing(request, FixedCosts(rent=Decimal("3000.00")))
+
+    assert len(result.alternatives) <= 3
+    for plan in result.alternatives:
+        assert result.best.net_profit - plan.net_profit <= Decimal("500.00")
+        assert plan.labor_pct_of_sales <= 0.45
+
+def test_optimizer_no_feasible_plan():
+    # Labor can never fall under 45% of sales at this wage
+    request = _request(
+        base_inputs=_request().base_inputs.model_copy(update={"stylist_hourly_rate": Decimal("200.00")})
+    )
+    result = optimize_staffing(request, FixedCosts())
+
+    assert result.best is None
+    assert result.alternatives == []
+
+@pytest.mark.parametrize("overrides", [
+    {"price_step": Decimal("0.0001"), "max_price_per_cut": Decimal("100000.00")},
+    {"max_stylists": 100000},
+    {"max_hours_per_day": Decimal("25")},
+    {"hours_step": Decimal("0")},
+    {"price_step": Decimal("-1")},
+])
+def test_optimizer_rejects_oversized_or_invalid_search_space(overrides):
+    with pytest.raises(ValidationError):
+        _request(**overrides)
+
+def test_optimizer_grid_cap_is_inclusive():
+    # 1 stylist x 1 hour value x exactly the cap in prices
+    request = _request(
+        max_stylists=1, max_hours_per_day=Decimal("4"),
+        price_step=Decimal("0.01"), max_price_per_cut=Decimal("25.00") + Decimal("0.01") * (OPTIMIZER_MAX_GRID_POINTS - 1),
+    )
+    assert request.max_stylists == 1
+
+@pytest.mark.asyncio
+async def test_optimize_endpoint_rejects_oversized_grid(client):
+    body = _request().model_dump(mode="json")
+    body["price_step"] = "0.0001"
+    body["max_price_per_cut"] = "1000000.00"
+    token = base64.b64encode(b"admin:password").decode()
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        resp = await ac.post("/optimize", json=body, headers={"Authorization": f"Basic {token}"})
+    assert resp.status_code == 422
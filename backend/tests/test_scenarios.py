@@ -0,0 +1,66 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch
+import base64
+from app.api import scenarios as scenarios_api
+
+def get_auth_headers(username="admin", password="password"):
+    credentials = f"{username}:{password}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+INPUTS = {
+    "operating_days_per_month": 30,
+    "haircuts_per_day": 20,
+    "price_per_cut": 30,
+    "num_stylists": 1,
+    "stylist_hours_per_day": 8,
+    "stylist_hourly_rate": 20,
+}
+
+@pytest.mark.asyncio
+async def test_scenario_snapshot_recomputed_only_when_costs_change(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        resp = await ac.post("/scenarios", json={"name": "Base", "inputs": INPUTS}, headers=auth)
+        assert resp.status_code == 200
+        created = resp.json()
+        version = created["costs_version"]
+
+        # Up to date: listing must not recompute
+        with patch.object(scenarios_api, "calculate_forecast", side_effect=AssertionError):
+            resp = await ac.get("/scenarios", headers=auth)
+        assert resp.status_code == 200
+        assert resp.json()[0]["snapshot"] == created["snapshot"]
+
+        # Changing fixed costs makes the snapshot stale
+        costs = (await ac.get("/costs", headers=auth)).json()
+        costs["rent"] = "7286.70"
+        await ac.post("/costs", json=costs, headers=auth)
+
+        resp = await ac.get(f"/scenarios/{created['id']}", headers=auth)
+        refreshed = resp.json()
+        assert refreshed["costs_version"] != version
+        assert float(refreshed["snapshot"]["net_profit"]) == float(created["snapshot"]["net_profit"]) - 1000
+
+@pytest.mark.asyncio
+async def test_compare_against_baseline(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        base = (await ac.post(
+            "/scenarios", json={"name": "Base", "inputs": INPUTS, "is_baseline": True}, headers=auth
+        )).json()
+        busier = (await ac.post(
+            "/scenarios", json={"name": "Busier", "inputs": {**INPUTS, "haircuts_per_day": 25}}, headers=auth
+        )).json()
+
+        resp = await ac.get("/scenarios/compare", params={"scenario_id": busier["id"]}, headers=auth)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["baseline_id"] == base["id"]
+        # 5 extra cuts * $30 * 30 days
+        assert float(data["deltas"]["service_revenue"]["delta"]) == 4500.00
+        assert float(data["deltas"]["total_monthly_fixed_costs"]["delta"]) == 0
+
+        resp = await ac.post("/scenarios", json={"name": "Base", "inputs": INPUTS}, headers=auth)
+        assert resp.status_code == 409
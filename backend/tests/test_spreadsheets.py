@@ -0,0 +1,107 @@
+import io
+import pytest
+from decimal import Decimal
+from httpx import AsyncClient, ASGITransport
+from openpyxl import load_workbook
+import base64
+from app.domain.models import CostCategory, CostItem
+from app.domain.pnl import parse_pnl_rows
+
+def get_auth_headers(username="admin", password="password"):
+    credentials = f"{username}:{password}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+INPUTS = {
+    "operating_days_per_month": 30,
+    "haircuts_per_day": 22,
+    "price_per_cut": "31.00",
+    "num_stylists": 1,
+    "stylist_hours_per_day": "17",
+    "stylist_hourly_rate": "22.00",
+    "retail_sales": "2000.00",
+}
+
+def test_parse_pnl_rows_matches_spreadsheet_labels():
+    rows = [
+        ("Fixed Expenses",),
+        ("Meals & Entertainment", None, 125),
+        ("RENT", "$6,500.00"),
+        ("Royalties %", "6%"),
+        ("Royalties", 1123.0),  # computed line, not an input
+        ("Notes", "n/a"),
+        (),
+    ]
+    fixed, inputs, rows_read = parse_pnl_rows(rows)
+
+    assert fixed == {"meals_entertainment": Decimal("125"), "rent": Decimal("6500.00")}
+    assert inputs == {"royalties_pct": Decimal("0.06")}
+    assert rows_read == 7
+
+@pytest.mark.asyncio
+async def test_forecast_export_imports_back(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        resp = await ac.post("/export/forecast.xlsx", json=INPUTS, headers=auth)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/vnd.openxmlformats")
+
+        sheet = load_workbook(io.BytesIO(resp.content), read_only=True)["P&L"]
+        labels = {row[0]: row[1] if len(row) > 1 else None for row in sheet.iter_rows(values_only=True)}
+        assert Decimal(str(labels["Total Revenue"])) == Decimal("22460.00")
+
+        # Edit rent in the workbook and import it
+        workbook = load_workbook(io.BytesIO(resp.content))
+        for row in workbook["P&L"].iter_rows():
+            if row[0].value == "Rent":
+                row[1].value = 7000
+        upload = io.BytesIO()
+        workbook.save(upload)
+
+        resp = await ac.post(
+            "/import/pnl", files={"file": ("pnl.xlsx", upload.getvalue())}, headers=auth
+        )
+        assert resp.status_code == 200
+        result = resp.json()
+        assert "rent" in result["fixed_costs_updated"]
+        assert result["input_errors"] == []
+        assert result["inputs"]["haircuts_per_day"] == 22
+        assert Decimal(result["inputs"]["price_per_cut"]) == Decimal("31.00")
+
+        costs = (await ac.get("/costs", headers=auth)).json()
+        assert Decimal(costs["rent"]) == Decimal("7000.00")
+
+@pytest.mark.asyncio
+async def test_ledger_and_scenario_exports(client, session):
+    category = CostCategory(name="Build-out", projected_total=Decimal("10000.00"))
+    session.add(category)
+    session.commit()
+    for i in range(25):
+        session.add(CostItem(
+            category_id=category.id, description=f"Item {i}", vendor="Acme",
+            amount=Decimal("19.99"), status="paid", date="2024-01-01",
+        ))
+    session.commit()
+
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        auth = get_auth_headers()
+        resp = await ac.get("/export/ledger.xlsx", headers=auth)
+        rows = list(load_workbook(io.BytesIO(resp.content), read_only=True)["Ledger"].iter_rows(values_only=True))
+        assert len(rows) == 26
+        assert rows[1][-1] == "Build-out"
+        assert Decimal(str(rows[1][4])) == Decimal("19.99")
+
+        await ac.post("/scenarios", json={"name": "Base", "inputs": INPUTS}, headers=auth)
+        resp = await ac.get("/export/scenarios.xlsx", headers=auth)
+        rows = list(load_workbook(io.BytesIO(resp.content), read_only=True)["Scenarios"].iter_rows(values_only=True))
+        assert rows[0][0] == "Name"
+        assert rows[1][0] == "Base"
+        assert "Net Profit" in rows[0]
+
+@pytest.mark.asyncio
+async def test_import_rejects_non_workbook(client):
+    async with AsyncClient(transport=ASGITransport(app=client), base_url="http://test") as ac:
+        resp = await ac.post(
+            "/import/pnl", files={"file": ("pnl.xlsx", b"not a workbook")}, headers=get_auth_headers()
+        )
+    assert resp.status_code == 422